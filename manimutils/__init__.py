@@ -1,6 +1,32 @@
-from . import animations
-from .audioslide import AudioSlide
-from .slide import CustomSlide
-from . import mobjects
-from .mobjects import *
-from .ratefuncs import radical_linear_quadratic
+import importlib
+
+from .mobjects import __all__ as _mobjects_all
+
+# Everything is resolved lazily (PEP 562) so that e.g. `from manimutils import CustomSlide`
+# does not import moviepy, torch or librosa. Note that `from manimutils import *`
+# still resolves (and therefore imports) every public name.
+_lazy_attributes = {
+    'AudioSlide': '.audioslide',
+    'CustomSlide': '.slide',
+    'radical_linear_quadratic': '.ratefuncs',
+}
+_lazy_attributes |= {name: '.mobjects' for name in _mobjects_all}
+
+_lazy_submodules = {'animations', 'mobjects', 'ratefuncs', 'audioslide', 'slide'}
+
+__all__ = ['animations', 'mobjects'] + list(_lazy_attributes)
+
+
+def __getattr__(name):
+    if name in _lazy_submodules:
+        return importlib.import_module(f'.{name}', __name__)
+    if name in _lazy_attributes:
+        module = importlib.import_module(_lazy_attributes[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
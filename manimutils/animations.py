@@ -1,5 +1,4 @@
 from manim import *
-from manimutils.mobjects import *
 from typing import Callable, Sequence
 
 
@@ -149,7 +148,7 @@ class TrueReplacementTransform(ReplacementTransform):
         return True
 
 class STFT(Succession):
-    def __init__(self, wave: Waveform, spec: Spectrogram, **kwargs):
+    def __init__(self, wave: 'Waveform', spec: 'Spectrogram', **kwargs):
         boundary_rectangle = Rectangle(
             color=wave['curve']['upper'].get_color(),
             height=spec.height,
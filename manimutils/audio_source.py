@@ -0,0 +1,100 @@
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+import scipy.io.wavfile
+
+
+class WavSource:
+    """Memory-mapped WAV file.
+
+    Samples are not loaded as a whole (unless scipy can't memory-map the
+    format, like 24-bit PCM): peak and mono downmix are computed
+    in chunks, so long recordings cost at most one float32 copy (none at all
+    if the file is already mono float32 and no normalization is requested).
+    """
+
+    def __init__(self, file, chunk_size: int = 1 << 20):
+        self.file = Path(file)
+        self.chunk_size = chunk_size
+        try:
+            sr, data = scipy.io.wavfile.read(self.file, mmap=True)
+        except ValueError:
+            # scipy can't memory-map every format (e.g. 24-bit PCM), those are
+            # read as a whole (24-bit samples come back as full-scale int32)
+            sr, data = scipy.io.wavfile.read(self.file)
+        self.sr = int(sr)
+        # scipy gives TxC for multichannel files and T for mono
+        self.data: np.ndarray = data
+        self._peak = None
+
+    @property
+    def num_channels(self) -> int:
+        return 1 if self.data.ndim == 1 else self.data.shape[1]
+
+    @property
+    def num_samples(self) -> int:
+        return self.data.shape[0]
+
+    @property
+    def duration(self) -> float:
+        return self.num_samples / self.sr
+
+    def __len__(self):
+        return self.num_samples
+
+    def chunks(self, chunk_size: int | None = None) -> Iterator[np.ndarray]:
+        """Yields float32 chunks in the file's own scale (T or TxC)"""
+        if chunk_size is None:
+            chunk_size = self.chunk_size
+        for start in range(0, self.num_samples, chunk_size):
+            yield np.asarray(self.data[start:start+chunk_size], dtype=np.float32)
+
+    @property
+    def peak(self) -> float:
+        """Maximum absolute sample value across all channels"""
+        if self._peak is None:
+            self._peak = max((float(abs(chunk).max()) for chunk in self.chunks()), default=0.)
+        return self._peak
+
+    @property
+    def full_scale(self) -> float:
+        """Value corresponding to 1.0 for the file's sample format"""
+        if np.issubdtype(self.data.dtype, np.integer):
+            return float(np.iinfo(self.data.dtype).max) + 1
+        return 1.
+
+    def as_float32(self, normalize: bool = False) -> np.ndarray:
+        """All channels as a float32 array in T or TxC format"""
+        if self.data.dtype == np.float32 and not normalize:
+            return self.data
+        out = np.empty(self.data.shape, dtype=np.float32)
+        scale = 1. / self.peak if normalize and self.peak > 0 else 1.
+        for start, chunk in zip(range(0, self.num_samples, self.chunk_size), self.chunks()):
+            np.multiply(chunk, scale, out=out[start:start+len(chunk)])
+        return out
+
+    def mono(self, normalize: bool = False) -> np.ndarray:
+        """Mean of all channels as a float32 array of length T.
+
+        With `normalize`, the downmix (not the individual channels) is
+        scaled to a peak of 1.
+        """
+        if self.num_channels == 1:
+            if self.data.dtype == np.float32 and not normalize:
+                return self.data
+            out = np.empty(self.num_samples, dtype=np.float32)
+            for start, chunk in zip(range(0, self.num_samples, self.chunk_size), self.chunks()):
+                out[start:start+len(chunk)] = chunk
+        else:
+            out = np.empty(self.num_samples, dtype=np.float32)
+            for start, chunk in zip(range(0, self.num_samples, self.chunk_size), self.chunks()):
+                chunk.mean(1, out=out[start:start+len(chunk)])
+        if normalize:
+            peak = max(
+                (float(abs(out[start:start+self.chunk_size]).max()) for start in range(0, len(out), self.chunk_size)),
+                default=0.
+            )
+            if peak > 0:
+                out /= peak
+        return out
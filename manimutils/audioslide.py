@@ -1,31 +1,455 @@
 import os
+import sys
+import csv
+import time
+import json
+import hashlib
+import subprocess
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
 
 from manim import *
 import manim
 from manim_slides import Slide
 from manim_slides.slide.animation import Wipe
 
-import scipy
-import scipy.io
-
 from tqdm import tqdm
 import shutil
 import platform
 
-import moviepy as mpy
-
 from manim_slides.config import BaseSlideConfig, PresentationConfig, PreSlideConfig, SlideConfig
 from manim_slides.utils import concatenate_video_files, merge_basenames, reverse_video_file
 
+
+def _mux_audio_moviepy(dst_file: Path, audio_file):
+    import moviepy as mpy
+    from .audio_source import WavSource
+    video = mpy.VideoFileClip(dst_file)
+    source = WavSource(audio_file)
+    sr = source.sr
+    _audio = source.as_float32(normalize=True)
+    if _audio.ndim == 1:
+        _audio = np.broadcast_to(_audio[..., None], (len(_audio), 2))
+    audio = mpy.AudioArrayClip(_audio, fps=sr)
+    bed = mpy.AudioClip(lambda t: np.array([0.0, 0.0]), duration=video.duration, fps=44100)
+    audio = mpy.CompositeAudioClip([bed, audio.with_start(0)]).with_duration(video.duration)
+
+    video: mpy.VideoFileClip = video.with_audio(audio)
+    video.write_videofile(dst_file.with_suffix('.tmp.mp4'), fps=video.fps, audio=True, audio_fps=sr)
+
+    os.replace(dst_file.with_suffix('.tmp.mp4'), dst_file)
+
+
+def _mux_audio_ffmpeg(dst_file: Path, audio_file):
+    """Mux audio into `dst_file` without touching the video stream.
+
+    The video is stream-copied, so only the audio track is encoded.
+    It is peak-normalized like the moviepy backend and padded with
+    silence (or cut) to the video duration.
+    """
+    ffmpeg = shutil.which('ffmpeg')
+    if ffmpeg is None:
+        raise FileNotFoundError('ffmpeg executable not found')
+    from .audio_source import WavSource
+    source = WavSource(audio_file)
+    # ffmpeg sees samples relative to full scale
+    peak = source.peak / source.full_scale
+    gain = 1. / peak if peak > 0 else 1.
+    audio_codec = 'libopus' if dst_file.suffix == '.webm' else 'aac'
+    tmp_file = dst_file.with_suffix('.tmp' + dst_file.suffix)
+    subprocess.run([
+        ffmpeg, '-y', '-loglevel', 'error',
+        '-i', str(dst_file),
+        '-i', str(audio_file),
+        '-map', '0:v:0', '-map', '1:a:0',
+        '-c:v', 'copy',
+        '-af', f'volume={gain},apad',
+        '-ac', '2',
+        '-c:a', audio_codec,
+        '-shortest',
+        str(tmp_file),
+    ], check=True, capture_output=True)
+    os.replace(tmp_file, dst_file)
+
+
+_mux_backends = {
+    'ffmpeg': _mux_audio_ffmpeg,
+    'moviepy': _mux_audio_moviepy,
+}
+
+
+def _mux_audio(dst_file: Path, audio_file, backend='ffmpeg'):
+    if backend == 'ffmpeg':
+        try:
+            return _mux_audio_ffmpeg(dst_file, audio_file)
+        except (OSError, ValueError, subprocess.CalledProcessError) as e:
+            stderr = getattr(e, 'stderr', None)
+            if isinstance(stderr, bytes):
+                stderr = stderr.decode('utf-8', errors='replace')
+            details = f":\n{stderr.strip()}" if stderr and stderr.strip() else ''
+            logger.warning(
+                f"ffmpeg audio muxing failed for '{dst_file.name}' ({e!r}), falling back to moviepy{details}"
+            )
+            backend = 'moviepy'
+    return _mux_backends[backend](dst_file, audio_file)
+
+
+def _slide_fingerprint(slide_files: list[Path], audio_file=None, mux_backend=None, static_tolerance=None) -> str:
+    """Hash of everything that goes into a slide's exported files.
+
+    Partial movie files are already named after a hash of their content,
+    so their names are enough. Audio files are identified by path, size
+    and modification time. The static tolerance decides whether a slide is
+    collapsed to a still, so it is part of the key too.
+    """
+    key = {'files': [Path(file).name for file in slide_files], 'static_tolerance': static_tolerance}
+    if audio_file is not None:
+        stat = os.stat(audio_file)
+        key['audio'] = [str(Path(audio_file).resolve()), stat.st_size, stat.st_mtime_ns]
+        key['mux_backend'] = mux_backend
+    return hashlib.sha256(json.dumps(key).encode('utf-8')).hexdigest()
+
+
+def _read_json(json_file: Path) -> dict:
+    try:
+        with open(json_file) as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_json(json_file: Path, data: dict):
+    tmp_file = json_file.with_suffix('.tmp')
+    with open(tmp_file, 'w') as file:
+        json.dump(data, file, indent=2, sort_keys=True)
+    os.replace(tmp_file, json_file)
+
+
+def _static_frame(video_file: Path, tolerance: int = 2):
+    """Returns `(frame, num_frames, stream_info)` if every frame of `video_file`
+    is within `tolerance` of the first one (in 0-255 RGB), else None.
+
+    Stops decoding at the first frame that differs, so animated slides
+    are rejected almost immediately.
+    """
+    import av
+    with av.open(str(video_file)) as container:
+        stream = container.streams.video[0]
+        first = None
+        num_frames = 0
+        for frame in container.decode(stream):
+            array = frame.to_ndarray(format='rgb24')
+            if first is None:
+                first = array
+            elif np.abs(array.astype(np.int16) - first).max() > tolerance:
+                return None
+            num_frames += 1
+        stream_info = dict(
+            codec_name=stream.codec_context.name,
+            rate=stream.average_rate,
+            width=stream.width,
+            height=stream.height,
+            pix_fmt=stream.pix_fmt,
+        )
+    if first is None:
+        return None
+    return first, num_frames, stream_info
+
+
+def _encode_still(video_file: Path, frame: np.ndarray, num_frames: int, stream_info: dict):
+    """Replace `video_file` with `frame` held for `num_frames` frames.
+
+    Only two frames are encoded (the first and the last timestamp),
+    players hold the first one in between.
+    """
+    import av
+    tmp_file = video_file.with_suffix('.tmp' + video_file.suffix)
+    with av.open(str(tmp_file), 'w') as container:
+        stream = container.add_stream(stream_info['codec_name'], rate=stream_info['rate'])
+        stream.width = stream_info['width']
+        stream.height = stream_info['height']
+        stream.pix_fmt = stream_info['pix_fmt']
+        for pts in sorted({0, num_frames - 1}):
+            still = av.VideoFrame.from_ndarray(frame, format='rgb24')
+            still.pts = pts
+            for packet in stream.encode(still):
+                container.mux(packet)
+        for packet in stream.encode():
+            container.mux(packet)
+    os.replace(tmp_file, video_file)
+
+
+@contextmanager
+def _stage(timings: dict, name: str):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = timings.get(name, 0.) + time.perf_counter() - start
+
+
+def _export_slide(
+    slide_files: list[Path],
+    dst_file: Path,
+    rev_file: Path,
+    audio_file=None,
+    cache_valid: bool = True,
+    reverse: str = 'now',
+    mux_backend: str = 'ffmpeg',
+    static_tolerance: int | None = 2,
+    reverse_kwargs: dict | None = None,
+) -> dict:
+    """Concatenate, optionally mux audio into, and reverse a single slide.
+
+    Runs in a worker process, so everything here must be picklable.
+    `reverse` is one of 'now', 'later' (left to `_reverse_pending`) or
+    'never'. Slides whose frames are all identical (up to `static_tolerance`,
+    None to disable) are encoded as a still and are their own reverse.
+    Returns the path of the reversed file (`dst_file` itself if the slide
+    was not reversed), whether the slide is static, and per-stage timings
+    and file sizes for the export report.
+    """
+    reverse_kwargs = reverse_kwargs or {}
+    timings = {}
+    # We only concat animations (and mux audio) if they are missing or stale
+    rebuilt = False
+    static = False
+    did_reverse = False
+    if not cache_valid or not dst_file.exists():
+        with _stage(timings, 'concatenate'):
+            concatenate_video_files(slide_files, dst_file)
+        if static_tolerance is not None:
+            with _stage(timings, 'static'):
+                if still := _static_frame(dst_file, static_tolerance):
+                    _encode_still(dst_file, *still)
+                    static = True
+        if audio_file is not None:
+            with _stage(timings, 'mux'):
+                _mux_audio(dst_file, audio_file, backend=mux_backend)
+        rebuilt = True
+
+    # We only reverse video if it was not present or the slide changed
+    if rebuilt or not rev_file.exists():
+        if not rebuilt and static_tolerance is not None:
+            # cached slides are already encoded as stills, so this is cheap
+            with _stage(timings, 'static'):
+                static = _static_frame(dst_file, static_tolerance) is not None
+        if reverse == 'now' and not static:
+            with _stage(timings, 'reverse'):
+                reverse_video_file(dst_file, rev_file, **reverse_kwargs)
+            did_reverse = True
+        else:
+            if rev_file.exists():
+                # stale, it was made from a previous version of the slide
+                rev_file.unlink()
+            rev_file = dst_file
+
+    output_bytes = dst_file.stat().st_size
+    if rev_file != dst_file:
+        output_bytes += rev_file.stat().st_size
+
+    return dict(
+        rev_file=rev_file,
+        static=static,
+        cache_hit=not rebuilt,
+        audio_muxed=rebuilt and audio_file is not None,
+        reversed=did_reverse,
+        input_bytes=sum(Path(file).stat().st_size for file in slide_files),
+        output_bytes=output_bytes,
+        timings=timings,
+    )
+
+
+def _patch_presentation(slide_path: Path, files_folder: Path, dst_name: str, rev_name: str):
+    config = PresentationConfig.from_file(slide_path)
+    for slide in config.slides:
+        if slide.file.name == dst_name:
+            slide.rev_file = files_folder / rev_name
+    tmp_file = slide_path.with_suffix('.tmp.json')
+    config.to_file(tmp_file)
+    os.replace(tmp_file, slide_path)
+
+
+# Only uses the standard library until manimutils is imported, so that a
+# failing import can still be recorded in the status file
+_REVERSER_SCRIPT = """
+import json, sys, traceback
+status_file = sys.argv[1]
+try:
+    from manimutils.audioslide import _reverse_pending
+except BaseException:
+    with open(status_file) as file:
+        status = json.load(file)
+    status['error'] = traceback.format_exc()
+    status['pid'] = None
+    with open(status_file, 'w') as file:
+        json.dump(status, file, indent=2, sort_keys=True)
+    raise
+_reverse_pending(status_file)
+"""
+
+
+def _start_reverser(status_file: Path):
+    """Run `_reverse_pending` in a detached process, with stderr logged next to `status_file`"""
+    status_file = status_file.absolute()
+    log_file = status_file.with_name('reversal.log')
+    # the child must find manimutils (and its dependencies) the same way we did
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(path or os.getcwd() for path in sys.path))
+    try:
+        with open(log_file, 'w') as log:
+            subprocess.Popen(
+                [sys.executable, '-c', _REVERSER_SCRIPT, str(status_file)],
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                env=env,
+                start_new_session=True,
+            )
+    except OSError as e:
+        status = _read_json(status_file)
+        status['error'] = f'failed to start the reversal process: {e!r}'
+        _write_json(status_file, status)
+        logger.error(f"Failed to start background reversal: {e!r}")
+
+
+def _reverser_alive(pid):
+    if not pid:
+        return False
+    # os.kill on Windows terminates the process instead of probing it
+    if platform.system() == 'Windows':
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _wait_for_reverser(status_file: Path, poll_interval=0.5):
+    """Wait until the reversal process recorded in `status_file` (if any) has exited
+
+    Otherwise it could still be writing the presentation file and the
+    reversed videos while a new render replaces them.
+    """
+    pid = _read_json(status_file).get('pid')
+    if not _reverser_alive(pid):
+        return
+    logger.info(f"Waiting for the previous background reversal (pid {pid}) to finish")
+    while _reverser_alive(pid) and _read_json(status_file).get('pid') == pid:
+        time.sleep(poll_interval)
+
+
+def _reverse_pending(status_file):
+    """Reverse the slides listed as pending in `status_file`.
+
+    Runs detached from the render, after the presentation file is written.
+    The presentation file and `status_file` are updated after every slide
+    so the presentation stays usable (with forward-only playback for the
+    pending slides) the whole time.
+    """
+    status_file = Path(status_file)
+    files_folder = status_file.parent
+    status = _read_json(status_file)
+    slide_path = Path(status['presentation'])
+    status['pid'] = os.getpid()
+    _write_json(status_file, status)
+    try:
+        for dst_name, rev_name in list(status['pending'].items()):
+            dst_file = files_folder / dst_name
+            rev_file = files_folder / rev_name
+            tmp_file = rev_file.with_suffix('.tmp' + rev_file.suffix)
+            try:
+                reverse_video_file(dst_file, tmp_file, leave=False, disable=True, **status['reverse_kwargs'])
+                os.replace(tmp_file, rev_file)
+                _patch_presentation(slide_path, files_folder, dst_name, rev_name)
+            except Exception as e:
+                status['failed'][dst_name] = repr(e)
+            else:
+                status['done'].append(dst_name)
+            del status['pending'][dst_name]
+            _write_json(status_file, status)
+    except BaseException:
+        # otherwise the remaining slides would look pending forever
+        import traceback
+        status['error'] = traceback.format_exc()
+        status['pid'] = None
+        _write_json(status_file, status)
+        raise
+    status['pid'] = None
+    _write_json(status_file, status)
+
+
 class AudioSlide(Slide):
+    # 'ffmpeg' stream-copies the video and only encodes audio,
+    # 'moviepy' re-encodes everything (used as a fallback)
+    audio_mux_backend: str = 'ffmpeg'
+    # 'eager' reverses every slide before writing the presentation,
+    # 'deferred' writes the presentation first and reverses in a background process,
+    # 'opt_in' only reverses slides created with `next_slide(reverse=True)`
+    reverse_mode: str = 'eager'
+    # Slides whose frames are all within this (0-255) tolerance of each other
+    # are encoded as a single still and not reversed, None disables the check
+    static_slide_tolerance: int | None = 2
+    # A per-slide timing/size report is always written next to the presentation
+    # file as <scene>.report.json and <scene>.report.csv, this also prints it
+    print_export_report: bool = False
+    # Rehearsal builds: render at `draft_resolution` and `draft_frame_rate`,
+    # never reverse or mux audio, and write the presentation to a 'draft'
+    # subfolder so the final build's files are left alone (partial movies are
+    # already kept apart by manim's per-quality folders).
+    # Can be set from the command line with MANIMUTILS_DRAFT=1
+    draft: bool = False
+    draft_resolution: tuple = (854, 480)
+    draft_frame_rate: int = 15
+
+    def __init__(self, *args, **kwargs):
+        # The camera and file writer are set up from the config in Scene.__init__
+        with self._draft_config():
+            super().__init__(*args, **kwargs)
+        if self.is_draft:
+            self._output_folder = Path(self._output_folder) / 'draft'
+
+    def render(self, *args, **kwargs):
+        with self._draft_config():
+            return super().render(*args, **kwargs)
+
+    @contextmanager
+    def _draft_config(self):
+        """Draft resolution and frame rate in manim's config, put back on exit
+        (even on errors) for whatever runs after this scene"""
+        if not self.is_draft:
+            yield
+            return
+        restore = {
+            key: manim.config[key]
+            for key in ('pixel_width', 'pixel_height', 'frame_rate')
+        }
+        manim.config.pixel_width, manim.config.pixel_height = self.draft_resolution
+        manim.config.frame_rate = self.draft_frame_rate
+        try:
+            yield
+        finally:
+            for key, value in restore.items():
+                manim.config[key] = value
 
-    def next_slide(self, *args, audio_file=None, **kwargs):
+    @property
+    def is_draft(self) -> bool:
+        env = os.environ.get('MANIMUTILS_DRAFT')
+        if env is not None:
+            return env.lower() not in ('', '0', 'false', 'no')
+        return self.draft
+
+    def next_slide(self, *args, audio_file=None, reverse=None, **kwargs):
         super().next_slide(*args, **kwargs)
         # you can't stop me
         # I will monkey patch you
         if audio_file is not None:
             self._slides[-1].__dict__['audio_file'] = audio_file
+        if reverse is not None:
+            self._slides[-1].__dict__['reverse'] = reverse
 
     def _save_slides(  # noqa: C901
         self,
@@ -36,6 +460,11 @@ class AudioSlide(Slide):
         """
         Save slides, optionally using cached files.
 
+        Slides are independent of each other, so they are exported in a
+        process pool of ``self.num_processes`` workers. If some slides fail,
+        the others are still exported and written to the presentation file
+        before the failures are raised.
+
         .. warning:
             Caching files only work with Manim.
         """
@@ -62,16 +491,18 @@ class AudioSlide(Slide):
                 slide.start_animation = max(0, slide.start_animation - offset)
                 slide.end_animation -= offset
 
-        slides: list[SlideConfig] = []
+        num_processes = self.num_processes or os.cpu_count() or 1
 
-        for pre_slide_config in tqdm(
-            self._slides,
-            desc=f"Concatenating animations to '{scene_files_folder}' and generating reversed animations",
-            leave=self._leave_progress_bar,
-            ascii=True if platform.system() == "Windows" else None,
-            disable=not self._show_progress_bar,
-            unit=" slides",
-        ):
+        if self.reverse_mode == 'deferred' and not self.is_draft:
+            # its finished reversals are reused by this export
+            _wait_for_reverser(scene_files_folder / 'reversal_status.json')
+
+        manifest_file = scene_files_folder / 'manifest.json'
+        manifest = _read_json(manifest_file)
+
+        jobs = []
+        fingerprints = []
+        for pre_slide_config in self._slides:
             if pre_slide_config.skip_animations:
                 continue
             if pre_slide_config.src:
@@ -85,51 +516,137 @@ class AudioSlide(Slide):
                 raise ValueError(
                     f"Failed to merge basenames of files for slide: {pre_slide_config!r}"
                 ) from e
-            dst_file = scene_files_folder / file.name
-            rev_file = scene_files_folder / f"{file.stem}_reversed{file.suffix}"
-
-            # We only concat animations if it was not present
-            if not use_cache or not dst_file.exists() or hasattr(pre_slide_config, 'audio_file'):
-                concatenate_video_files(slide_files, dst_file)
-
-            if hasattr(pre_slide_config, 'audio_file'):
-                video = mpy.VideoFileClip(dst_file)
-                sr, _audio = scipy.io.wavfile.read(pre_slide_config.audio_file)
-                sr = int(sr)
-                if len(_audio.shape) == 1:
-                    _audio = _audio[..., None]
-                    _audio = np.tile(_audio, (1, 2))
-                _audio = _audio.astype(np.float32) / abs(_audio).max()
-                audio = mpy.AudioArrayClip(_audio, fps=sr)
-                bed = mpy.AudioClip(lambda t: np.array([0.0, 0.0]), duration=video.duration, fps=44100)
-                audio = mpy.CompositeAudioClip([bed, audio.with_start(0)]).with_duration(video.duration)
-
-                video: mpy.VideoFileClip = video.with_audio(audio)
-                video.write_videofile(dst_file.with_suffix('.tmp.mp4'), fps=video.fps, audio=True, audio_fps=sr)
-
-                os.replace(dst_file.with_suffix('.tmp.mp4'), dst_file)
-
-
-            # We only reverse video if it was not present
-            if not use_cache or not rev_file.exists():
-                if skip_reversing:
-                    rev_file = dst_file
-                else:
-                    reverse_video_file(
-                        dst_file,
-                        rev_file,
-                        max_segment_duration=self.max_duration_before_split_reverse,
-                        num_processes=self.num_processes,
-                        leave=self._leave_progress_bar,
-                        ascii=True if platform.system() == "Windows" else None,
-                        disable=not self._show_progress_bar,
-                    )
-
-            slides.append(
-                SlideConfig.from_pre_slide_config_and_files(
-                    pre_slide_config, dst_file, rev_file
+            audio_file = None if self.is_draft else getattr(pre_slide_config, 'audio_file', None)
+            stem = file.stem
+            if audio_file is not None:
+                # the same animations with different audio are different files
+                stem += '_' + hashlib.sha256(str(Path(audio_file).resolve()).encode('utf-8')).hexdigest()[:8]
+            dst_file = scene_files_folder / f"{stem}{file.suffix}"
+            rev_file = scene_files_folder / f"{stem}_reversed{file.suffix}"
+
+            fingerprint = _slide_fingerprint(
+                slide_files, audio_file, self.audio_mux_backend, self.static_slide_tolerance
+            )
+            cached_fingerprint = manifest.get(dst_file.name)
+            # Files cached before the manifest existed are only trusted without audio
+            cache_valid = use_cache and (
+                cached_fingerprint == fingerprint
+                or (cached_fingerprint is None and audio_file is None)
+            )
+            fingerprints.append(fingerprint)
+
+            slide_reverse = getattr(pre_slide_config, 'reverse', None)
+            if skip_reversing or self.is_draft or slide_reverse is False:
+                reverse = 'never'
+            elif self.reverse_mode == 'opt_in':
+                reverse = 'now' if slide_reverse else 'never'
+            elif self.reverse_mode == 'deferred':
+                reverse = 'later'
+            else:
+                reverse = 'now'
+
+            jobs.append((pre_slide_config, dict(
+                slide_files=slide_files,
+                dst_file=dst_file,
+                rev_file=rev_file,
+                audio_file=audio_file,
+                cache_valid=cache_valid,
+                reverse=reverse,
+                mux_backend=self.audio_mux_backend,
+                static_tolerance=self.static_slide_tolerance,
+                reverse_kwargs=dict(
+                    max_segment_duration=self.max_duration_before_split_reverse,
+                    # slides are already spread over the pool
+                    num_processes=1 if num_processes > 1 else self.num_processes,
+                    leave=False,
+                    ascii=True if platform.system() == "Windows" else None,
+                    disable=True,
+                ),
+            )))
+
+        # Slides with the same animations and audio (e.g. a repeated agenda
+        # slide) share their files, so each file is exported by a single worker
+        # and the result used for all of them
+        exports: dict[str, list[int]] = {}
+        for i, (_, job) in enumerate(jobs):
+            exports.setdefault(job['dst_file'].name, []).append(i)
+        reverse_priority = {'never': 0, 'later': 1, 'now': 2}
+        export_jobs = []
+        for indices in exports.values():
+            export_job = dict(jobs[indices[0]][1])
+            export_job['reverse'] = max((jobs[i][1]['reverse'] for i in indices), key=reverse_priority.get)
+            export_jobs.append((indices, export_job))
+
+        export_start = time.perf_counter()
+        results: dict[int, dict] = {}
+        failures: dict[int, BaseException] = {}
+
+        def finish(indices, result=None, error=None):
+            for n, i in enumerate(indices):
+                if error is not None:
+                    failures[i] = error
+                    continue
+                job = jobs[i][1]
+                results[i] = dict(
+                    result,
+                    # only report the work once
+                    timings=result['timings'] if n == 0 else {},
+                    rev_file=job['dst_file'] if job['reverse'] == 'never' else result['rev_file'],
                 )
+
+        progress = tqdm(
+            total=len(export_jobs),
+            desc=f"Concatenating animations to '{scene_files_folder}' and generating reversed animations",
+            leave=self._leave_progress_bar,
+            ascii=True if platform.system() == "Windows" else None,
+            disable=not self._show_progress_bar,
+            unit=" slides",
+        )
+        with progress:
+            if num_processes == 1 or len(export_jobs) <= 1:
+                for indices, export_job in export_jobs:
+                    try:
+                        finish(indices, _export_slide(**export_job))
+                    except Exception as e:
+                        finish(indices, error=e)
+                    progress.update()
+            else:
+                with ProcessPoolExecutor(max_workers=min(num_processes, len(export_jobs))) as executor:
+                    futures = {
+                        executor.submit(_export_slide, **export_job): indices
+                        for indices, export_job in export_jobs
+                    }
+                    for future in as_completed(futures):
+                        indices = futures[future]
+                        try:
+                            finish(indices, future.result())
+                        except Exception as e:
+                            finish(indices, error=e)
+                        progress.update()
+
+        # Keep slides in their original order, whatever order they finished in
+        slides: list[SlideConfig] = [
+            SlideConfig.from_pre_slide_config_and_files(
+                pre_slide_config, job['dst_file'], results[i]['rev_file']
             )
+            for i, (pre_slide_config, job) in enumerate(jobs)
+            if i in results
+        ]
+
+        for i, e in sorted(failures.items()):
+            logger.error(f"Failed to export slide {i} ('{jobs[i][1]['dst_file'].name}'): {e!r}")
+
+        for i, (_, job) in enumerate(jobs):
+            if i in results:
+                manifest[job['dst_file'].name] = fingerprints[i]
+            else:
+                # The files on disk may be half-written. Without a manifest entry
+                # they would pass as a legacy cache (for slides without audio),
+                # so they are removed to force a rebuild.
+                manifest.pop(job['dst_file'].name, None)
+                job['dst_file'].unlink(missing_ok=True)
+                job['rev_file'].unlink(missing_ok=True)
+        _write_json(manifest_file, manifest)
 
         logger.info(
             f"Generated {len(slides)} slides to '{scene_files_folder.absolute()}'"
@@ -137,6 +654,17 @@ class AudioSlide(Slide):
 
         slide_path = self._output_folder / f"{scene_name}.json"
 
+        # deck slide of each presentation slide, to know which ones a partial render replaces
+        deck_file = scene_files_folder / 'deck_slides.json'
+        decks = [
+            getattr(pre_slide_config, 'deck_slide', None)
+            for i, (pre_slide_config, _) in enumerate(jobs)
+            if i in results
+        ]
+        if (rendered_decks := self._rendered_deck_slides()) is not None:
+            slides, decks = self._merge_with_presentation(slide_path, deck_file, slides, decks, rendered_decks)
+        _write_json(deck_file, {'deck_slides': decks})
+
         PresentationConfig(
             slides=slides,
             resolution=self._resolution,
@@ -145,4 +673,135 @@ class AudioSlide(Slide):
 
         logger.info(
             f"Slide '{scene_name}' configuration written in '{slide_path.absolute()}'"
-        )
\ No newline at end of file
+        )
+
+        self._write_export_report(
+            scene_name,
+            jobs,
+            results,
+            failures,
+            wall_time=time.perf_counter() - export_start,
+        )
+
+        if self.reverse_mode == 'deferred' and not self.is_draft:
+            pending = {
+                job['dst_file'].name: job['rev_file'].name
+                for i, (_, job) in enumerate(jobs)
+                if job['reverse'] == 'later' and i in results
+                and not results[i]['static'] and results[i]['rev_file'] == job['dst_file']
+            }
+            status_file = scene_files_folder / 'reversal_status.json'
+            _write_json(status_file, {
+                'presentation': str(slide_path.absolute()),
+                'pending': pending,
+                'done': [],
+                'failed': {},
+                'reverse_kwargs': {
+                    'max_segment_duration': self.max_duration_before_split_reverse,
+                    'num_processes': self.num_processes,
+                },
+            })
+            if pending:
+                _start_reverser(status_file)
+                logger.info(
+                    f"Reversing {len(pending)} slides in the background, see '{status_file.absolute()}'"
+                )
+
+        if failures:
+            raise RuntimeError(
+                f"Failed to export {len(failures)} of {len(jobs)} slides, "
+                f"see the log above; the remaining slides were written to '{slide_path}'"
+            ) from failures[min(failures)]
+
+    def _rendered_deck_slides(self):
+        """First and last deck slides rendered, or None when the whole scene is.
+
+        Deck slides are groups of slides (set as `deck_slide` on the slide
+        configs), a subclass rendering only some of them also overrides this
+        so that the other ones are kept from the existing presentation file.
+        """
+        return None
+
+    def _merge_with_presentation(self, slide_path, deck_file, slides, decks, rendered_decks):
+        """Put `slides` in place of the rendered deck slides of the existing presentation file"""
+        first, last = rendered_decks
+        if not slide_path.exists():
+            logger.warning(f"No existing '{slide_path}' to merge the rendered slides into")
+            return slides, decks
+        existing = PresentationConfig.from_file(slide_path).slides
+        existing_decks = _read_json(deck_file).get('deck_slides')
+        if existing_decks is None or len(existing_decks) != len(existing) or None in existing_decks:
+            logger.warning(
+                f"Unknown deck slides for '{slide_path}', only writing the rendered slides"
+            )
+            return slides, decks
+        if first is None:
+            logger.warning("None of the slides to render were found, keeping the existing presentation")
+            return existing, existing_decks
+        before = [i for i, deck in enumerate(existing_decks) if deck < first]
+        after = [i for i, deck in enumerate(existing_decks) if deck > last]
+        return (
+            [existing[i] for i in before] + slides + [existing[i] for i in after],
+            [existing_decks[i] for i in before] + decks + [existing_decks[i] for i in after],
+        )
+
+    _report_stages = ('concatenate', 'static', 'mux', 'reverse')
+
+    def _write_export_report(self, scene_name, jobs, results, failures, wall_time):
+        rows = []
+        for i, (_, job) in enumerate(jobs):
+            row = {
+                'index': i,
+                'file': job['dst_file'].name,
+                'status': 'ok' if i in results else 'failed',
+            }
+            if i in results:
+                result = results[i]
+                row |= {
+                    'cache_hit': result['cache_hit'],
+                    'static': result['static'],
+                    'audio_muxed': result['audio_muxed'],
+                    'reversed': result['reversed'],
+                    'input_bytes': result['input_bytes'],
+                    'output_bytes': result['output_bytes'],
+                }
+                timings = result['timings']
+            else:
+                row['error'] = repr(failures[i])
+                timings = {}
+            for stage in self._report_stages:
+                row[f'{stage}_seconds'] = round(timings.get(stage, 0.), 4)
+            row['total_seconds'] = round(sum(timings.values()), 4)
+            rows.append(row)
+
+        report_file = self._output_folder / f"{scene_name}.report.json"
+        with open(report_file, 'w') as file:
+            json.dump({
+                'scene': scene_name,
+                'wall_seconds': round(wall_time, 4),
+                'slides': rows,
+            }, file, indent=2)
+
+        fieldnames = list(dict.fromkeys(key for row in rows for key in row))
+        with open(report_file.with_suffix('.csv'), 'w', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=fieldnames)
+            writer.writeheader()
+            writer.writerows(rows)
+
+        logger.info(f"Export report written in '{report_file.absolute()}'")
+
+        if self.print_export_report:
+            from rich.table import Table
+            table = Table(title=f"Export of '{scene_name}' ({wall_time:.1f}s wall time)")
+            table.add_column('stage')
+            table.add_column('slides', justify='right')
+            table.add_column('seconds', justify='right')
+            for stage in self._report_stages:
+                column = f'{stage}_seconds'
+                count = sum(1 for row in rows if row[column] > 0)
+                total = sum(row[column] for row in rows)
+                table.add_row(stage, str(count), f'{total:.2f}')
+            hits = sum(1 for row in rows if row.get('cache_hit'))
+            table.add_row('cached', str(hits), '')
+            table.add_row('failed', str(len(failures)), '')
+            console.print(table)
@@ -1,15 +1,41 @@
-from .tensors import Tensor2D
-from .audio import Waveform, Spectrogram
-from .grid import Grid
-from .nn import NeuralNetwork
-from .pandas_table import PandasTable
-from .tensorboard_table import TensorBoardTable
-from .stemplot import StemPlotAxes
-from .tex import BetterMathTex, Footnote
-from .qr import QRMobject
-from .plot import BetterAxes
-from .multi_table import MultiTable
-from .bent_arrow import BentArrow
-from .varray import VArray
-from .diagram import Diagram
-from .audio_visualize import AudioVisualizer
+import importlib
+
+# Mobjects are resolved lazily (PEP 562) so that importing this package does
+# not drag in torch, librosa, pandas, etc. until the class is actually used.
+_lazy_attributes = {
+    'Tensor2D': 'tensors',
+    'Waveform': 'audio',
+    'Spectrogram': 'audio',
+    'Grid': 'grid',
+    'NeuralNetwork': 'nn',
+    'PandasTable': 'pandas_table',
+    'TensorBoardTable': 'tensorboard_table',
+    'StemPlotAxes': 'stemplot',
+    'BetterMathTex': 'tex',
+    'Footnote': 'tex',
+    'GlyphCounter': 'tex',
+    'QRMobject': 'qr',
+    'BetterAxes': 'plot',
+    'MultiTable': 'multi_table',
+    'BentArrow': 'bent_arrow',
+    'VArray': 'varray',
+    'Diagram': 'diagram',
+    'AudioVisualizer': 'audio_visualize',
+    'VideoMobject': 'video',
+    'CodeListing': 'code',
+}
+
+__all__ = list(_lazy_attributes)
+
+
+def __getattr__(name):
+    if name in _lazy_attributes:
+        module = importlib.import_module(f'.{_lazy_attributes[name]}', __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
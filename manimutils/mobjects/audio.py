@@ -1,4 +1,5 @@
 from manim import *
+import math
 import numpy as np
 from copy import deepcopy, copy
 import scipy
@@ -8,19 +9,125 @@ import scipy.fft
 import scipy.ndimage
 import torch
 
-from matplotlib import pyplot as plt
-from matplotlib.colors import PowerNorm, LinearSegmentedColormap
-from matplotlib.backends.backend_agg import FigureCanvasAgg
 # import tqdm
 
 from manimutils.mobjects.grid import Grid
+from manimutils.mobjects.plot import colormap_image, matplotlib_cmap, matplotlib_image
+from manimutils.audio_source import WavSource
 from manimutils.animations import *
 
+def envelope_curve(axes, xs, ys, **kwargs):
+    """The curve `axes.plot` draws through `(xs[i], ys[i])`, built from the arrays
+    directly instead of calling a function for each point"""
+    # only two samples, the points are replaced below
+    curve = axes.plot(
+        lambda x: np.interp(x, xs, ys),
+        x_range=[xs[0], xs[-1], max(xs[-1] - xs[0], 1)],
+        use_vectorized=True,
+        **kwargs
+    )
+    # the axes are linear, so coordinates map to points with a single affine transform
+    origin = axes.c2p(0, 0)
+    points = (
+        origin
+        + np.outer(xs, axes.c2p(1, 0) - origin)
+        + np.outer(ys, axes.c2p(0, 1) - origin)
+    )
+    curve.set_points_as_corners(points)
+    if curve.use_smoothing:
+        curve.make_smooth()
+    return curve
+
+def envelope_area(upper_curve, lower_curve, color, opacity=0.3):
+    """Same polygon as `axes.get_area(upper_curve, bounded_graph=lower_curve)`"""
+    area = VMobject()
+    area.set_points_as_corners(np.concatenate([
+        upper_curve.points,
+        lower_curve.points[::-1],
+        upper_curve.points[:1],
+    ]))
+    return area.set_opacity(opacity).set_color(color)
+
+def peak_envelope(audio, downsample_factor=8):
+    """Upper envelope of `audio`, interpolated between its peaks, at `1/downsample_factor` of the sample rate"""
+    peaks, _ = scipy.signal.find_peaks(abs(audio), distance=64)
+    if len(peaks) == 0:
+        return np.zeros(audio.shape[-1]//downsample_factor)
+    return np.interp(
+        np.arange(0, audio.shape[-1]//downsample_factor),
+        peaks/downsample_factor,
+        abs(audio)[peaks]
+    )
+
+class MinMaxPyramid:
+    """Indices of the minimum and maximum of `values` over aligned blocks of
+    `2**level` samples, for every level. Any range can then be reduced to
+    about `max_points` samples that keep its peaks, in time proportional to
+    `max_points` rather than to the length of the range."""
+
+    def __init__(self, values):
+        self.values = values
+        indices = np.arange(len(values), dtype=np.int32 if len(values) < 2**31 else np.int64)
+        self.mins = [indices]
+        self.maxs = [indices]
+        while len(self.mins[-1]) > 1:
+            lo, hi = self.mins[-1], self.maxs[-1]
+            if len(lo) % 2:
+                lo = np.append(lo, lo[-1])
+                hi = np.append(hi, hi[-1])
+            a, b = lo[0::2], lo[1::2]
+            self.mins.append(np.where(values[b] < values[a], b, a))
+            a, b = hi[0::2], hi[1::2]
+            self.maxs.append(np.where(values[b] > values[a], b, a))
+
+    def extremes(self, start, stop):
+        """Indices of the minimum and maximum of samples `start` to `stop`
+        (inclusive), from at most two blocks per level"""
+        lo, hi = start, stop + 1
+        candidates = []
+        level = 0
+        while lo < hi:
+            if lo & 1:
+                candidates += [self.mins[level][lo], self.maxs[level][lo]]
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                candidates += [self.mins[level][hi], self.maxs[level][hi]]
+            lo, hi, level = lo >> 1, hi >> 1, level + 1
+        candidates = np.array(candidates)
+        values = self.values[candidates]
+        return candidates[values.argmin()], candidates[values.argmax()]
+
+    def query(self, start, stop, max_points):
+        """Sorted indices of samples `start` to `stop` (inclusive), at the finest
+        level that fits in `max_points` (plus the endpoints)"""
+        span = stop - start + 1
+        level = 0
+        while level + 1 < len(self.mins) and 2 * -(-span // (1 << level)) > max_points:
+            level += 1
+        # blocks entirely inside the range
+        first, last = -(-start >> level), (stop + 1) >> level
+        indices = [
+            [start],
+            self.mins[level][first:last],
+            self.maxs[level][first:last],
+            [stop],
+        ]
+        # blocks at the edges stick out of the range, their part inside it
+        # is reduced separately so its peaks are kept
+        if start < first << level:
+            indices.append(self.extremes(start, min(stop, (first << level) - 1)))
+        if max(first, last) << level <= stop:
+            indices.append(self.extremes(last << level, stop))
+        return np.unique(np.concatenate(indices))
+
 class Waveform(VDict):
 
-    def __init__(self, audio, sr, normalize=True, frame_size=None, hop_size=None, axes_kwargs={}, curve_kwargs={}):
+    def __init__(self, audio, sr, normalize=True, frame_size=None, hop_size=None, axes_kwargs={}, curve_kwargs={}, max_points=None):
         """Takes `audio` in `CxT` or `T` format""" \
-        """and sample rate `sr` and constructs a Waveform mobject"""
+        """and sample rate `sr` and constructs a Waveform mobject.""" \
+        """The envelope is reduced to at most `max_points` points per curve,""" \
+        """by default two (min and max) per pixel of the axes' width"""
         if frame_size is None:
             frame_size = sr // 200 # 5ms
         if hop_size is None:
@@ -47,12 +154,7 @@ class Waveform(VDict):
 
         # print(audio.shape)
 
-        peaks, _ = scipy.signal.find_peaks(abs(audio), distance=64)
-        upper_contour = np.interp(
-            np.arange(0, audio.shape[-1]//downsample_factor),
-            peaks/downsample_factor,
-            abs(audio)[peaks]
-        )
+        upper_contour = peak_envelope(audio, downsample_factor)
         # upper_contour = scipy.ndimage.gaussian_filter1d(audio, sigma=1)
         # upper_contour = scipy.ndimage.uniform_filter1d(audio, 40)
         # upper_contour = scipy.signal.resample_poly(upper_contour, up=1, down=downsample_factor)
@@ -83,24 +185,15 @@ class Waveform(VDict):
             **axes_kwargs
         )
 
-        upper_curve = axes.plot(
-            (lambda x: upper_contour[round(x)]),
-            **curve_kwargs
-        )
-        lower_curve = axes.plot(
-            (lambda x: -upper_contour[round(x)]),
-            **curve_kwargs
-        )
-        if 'color' in curve_kwargs:
-            color=curve_kwargs['color']
-        else:
-            color=upper_curve.get_color()
-        area = axes.get_area(upper_curve, bounded_graph=lower_curve, color=color)
-        curve = VDict({
-            'upper': upper_curve,
-            'lower': lower_curve,
-            'area': area
-        })
+        if max_points is None:
+            max_points = 2 * math.ceil(axes.x_length * config['pixel_width'] / config['frame_width'])
+        self.max_points = max_points
+        self.downsample_factor = downsample_factor
+        self.envelope = upper_contour
+        self.envelope_rate = sr / downsample_factor
+        self.pyramid = MinMaxPyramid(upper_contour)
+        self.view = (0., len(upper_contour) / self.envelope_rate)
+        curve = self._envelope_curves(axes, 0, len(upper_contour) - 1)
 
         x_label = axes.get_x_axis_label('Time', UR, UR)
         x_label.shift(0.5*RIGHT)
@@ -119,10 +212,69 @@ class Waveform(VDict):
         self.sr = sr
 
     @classmethod
-    def from_wavfile(cls, file, **kwargs):
-        sr, audio = scipy.io.wavfile.read(file)
-        audio = audio.T # scipy -_-
-        return cls(audio, sr, **kwargs)
+    def from_wavfile(cls, file, normalize=True, **kwargs):
+        source = WavSource(file)
+        return cls(source.mono(normalize=normalize), source.sr, normalize=False, **kwargs)
+
+    def _envelope_curves(self, axes, start, stop):
+        """Curves and area of envelope samples `start` to `stop`, stretched over the whole x axis"""
+        indices = self.pyramid.query(start, stop, self.max_points)
+        return self._curves(axes, self.envelope, indices, start, stop)
+
+    def _audio_curves(self, audio):
+        """Curves and area of `audio` (at the same sample rate) on this waveform's axes,
+        without building a whole new Waveform"""
+        envelope = peak_envelope(audio, self.downsample_factor)
+        indices = MinMaxPyramid(envelope).query(0, len(envelope) - 1, self.max_points)
+        return self._curves(self['axes']['axes'], envelope, indices, 0, len(envelope) - 1)
+
+    def _curves(self, axes, envelope, indices, start, stop):
+        xs = (indices - start) * ((len(self.envelope) - 1) / max(stop - start, 1))
+        upper_curve = envelope_curve(axes, xs, envelope[indices], **self.curve_kwargs)
+        lower_curve = envelope_curve(axes, xs, -envelope[indices], **self.curve_kwargs)
+        if 'color' in self.curve_kwargs:
+            color=self.curve_kwargs['color']
+        else:
+            color=upper_curve.get_color()
+        area = envelope_area(upper_curve, lower_curve, color=color)
+        return VDict({
+            'upper': upper_curve,
+            'lower': lower_curve,
+            'area': area
+        })
+
+    def _view_curves(self, t0, t1):
+        start = int(np.clip(math.floor(t0 * self.envelope_rate), 0, len(self.envelope) - 1))
+        stop = int(np.clip(math.ceil(t1 * self.envelope_rate), start, len(self.envelope) - 1))
+        return self._envelope_curves(self['axes']['axes'], start, stop)
+
+    def zoom_to(self, t0, t1):
+        """Show only seconds `t0` to `t1` across the whole axes"""
+        self['curve'].become(self._view_curves(t0, t1))
+        self.view = (t0, t1)
+        return self
+
+    @override_animate(zoom_to)
+    def _zoom_to_animation(self, t0, t1, anim_args=None):
+        if anim_args is None:
+            anim_args = {}
+        (a0, b0), (a1, b1) = self.view, (t0, t1)
+        w0, w1 = b0 - a0, b1 - a1
+        c0, c1 = (a0 + b0) / 2, (a1 + b1) / 2
+
+        def update(curve, alpha):
+            # the width changes geometrically so the zoom speed looks constant,
+            # and the center follows the width
+            w = w0 ** (1 - alpha) * w1 ** alpha
+            if w0 != w1:
+                c = c0 + (c1 - c0) * (w0 - w) / (w0 - w1)
+            else:
+                c = c0 + (c1 - c0) * alpha
+            # every frame is at most `max_points` points, whatever the zoom level
+            curve.become(self._view_curves(c - w / 2, c + w / 2))
+            self.view = (c - w / 2, c + w / 2)
+
+        return UpdateFromAlphaFunc(self['curve'], update, **anim_args)
 
     @override_animation(Write)
     def _write(self, **kwargs):
@@ -177,48 +329,35 @@ class Waveform(VDict):
             hop_size=hop_size,
             **kwargs
         )
+        istft_kwargs = dict(
+            fs=self.sr,
+            nperseg=window_size,
+            nfft=n_fft,
+            noverlap=window_size-hop_size,
+        )
+        # The inverse STFT is linear, so the residual after band i is the full
+        # reconstruction minus bands 0..i. Bands are reconstructed in batches
+        # of single-bin spectrograms, sized to bound memory.
+        num_bins = spec.spec.shape[0]
+        batch_size = max(1, (1 << 24) // spec.spec.size)
+        _, residual_audio = scipy.signal.istft(spec.spec, **istft_kwargs)
+
         animations = []
-        previous_residual_waveform = self
-        for i in range(0, spec.spec.shape[0]):
-            filtered = spec.spec.copy()
-            filtered[:i] = 0
-            filtered[i+1:] = 0
-            _, filtered_audio = scipy.signal.istft(
-                filtered,
-                fs=self.sr,
-                nperseg=window_size,
-                nfft=n_fft,
-                noverlap=window_size-hop_size,
-                # input_onesided=True,
-                # boundary=None
-            )
-
-
-            filtered_waveform = Waveform(filtered_audio, self.sr, normalize=False, curve_kwargs=self.curve_kwargs) # TODO copy styling?
-            scalefactor = self['axes'].get_width() / filtered_waveform['axes'].get_width()
-            filtered_waveform.scale(scalefactor)
-            filtered_waveform.move_to(self)
-
-            residual = spec.spec.copy()
-            residual[:i+1] = 0
-            _, residual_audio = scipy.signal.istft(
-                residual,
-                fs=self.sr,
-                nperseg=window_size,
-                nfft=n_fft,
-                noverlap=window_size-hop_size,
-            )
-            residual_waveform = Waveform(residual_audio, self.sr, normalize=False, curve_kwargs=self.curve_kwargs)
-            residual_waveform.scale(scalefactor)
-            residual_waveform.move_to(self)
-
-            animations.append(AnimationGroup(
-                ReplacementTransform(previous_residual_waveform['curve'], residual_waveform['curve']),
-                TransformFromCopy(previous_residual_waveform['curve'], filtered_waveform['curve'])
-            ))
-            previous_residual_waveform = residual_waveform
-            if i > 2:
-                break
+        previous_residual_curve = self['curve']
+        for batch_start in range(0, num_bins, batch_size):
+            bins = np.arange(batch_start, min(batch_start + batch_size, num_bins))
+            masked = np.zeros((len(bins),) + spec.spec.shape, dtype=spec.spec.dtype)
+            masked[np.arange(len(bins)), bins] = spec.spec[bins]
+            _, band_audio = scipy.signal.istft(masked, freq_axis=-2, time_axis=-1, **istft_kwargs)
+            for filtered_audio in band_audio:
+                residual_audio = residual_audio - filtered_audio
+                filtered_curve = self._audio_curves(filtered_audio)
+                residual_curve = self._audio_curves(residual_audio)
+                animations.append(AnimationGroup(
+                    ReplacementTransform(previous_residual_curve, residual_curve),
+                    TransformFromCopy(previous_residual_curve, filtered_curve)
+                ))
+                previous_residual_curve = residual_curve
 
         # spec = Circle(4)
         # spec.move_to(self)
@@ -305,82 +444,93 @@ class Waveform(VDict):
 #         audio = audio.T # scipy -_-
 #         return cls.from_audio(audio, sr, n_fft, window_size, hop_size, normalize=normalize)
 
+def _nice_step(span, num_ticks=5):
+    """Round tick spacing (1, 2 or 5 times a power of ten) giving about `num_ticks` ticks over `span`"""
+    raw = span / num_ticks
+    magnitude = 10 ** math.floor(math.log10(raw))
+    for factor in (1, 2, 5, 10):
+        if raw <= factor * magnitude:
+            return factor * magnitude
+    return 10 * magnitude
+
 class Spectrogram(ImageMobject):
 
-    def __init__(self, time, freq, spec, aspect_ratio=4/3, powernorm=0.5, low_color=WHITE, high_color=ManimColor.from_rgb((0., 0.15, 0.4)), scale_y=True):
-        """Takes a spectrogram in FxT format"""
+    def __init__(self, time, freq, spec, aspect_ratio=4/3, powernorm=0.5, low_color=WHITE, high_color=ManimColor.from_rgb((0., 0.15, 0.4)), scale_y=True, height=3., backend='lut'):
+        """Takes a spectrogram in FxT format.
+
+        With the default `backend='lut'` the magnitudes are colored with a
+        lookup table at the pixel size of the `height` x `height*aspect_ratio`
+        plot area, under native manim axes. `backend='matplotlib'` draws
+        everything with matplotlib instead.
+        """
         if isinstance(spec, torch.Tensor):
             spec = spec.cpu().detach().numpy()
         self.spec = spec
-        # spec = spec[::-1]
-
-        # spec = spec ** powernorm
 
         magspec = abs(spec)
 
-        # N = spec.shape[0]
-        # M = spec.shape[1]
-        # colors = np.empty((N, M, 4), np.uint8)
-        # for i in range(N):
-        #     for j in range(M):
-        #         value = magspec[i, j]
-        #         c: ManimColor = (1-value) * low_color + value * high_color
-        #         colors[i, j, :] = c.to_int_rgba()
-
-        cmap = LinearSegmentedColormap.from_list(
-            'WhBu',
-            [
-                low_color.to_rgba(),
-                high_color.to_rgba()
-            ],
-            N=256,
-            gamma=1.0
+        if backend == 'matplotlib':
+            def draw(fig, ax):
+                # Set axes spines, ticks, and labels to white
+                ax.tick_params(colors='white')
+                for spine in ax.spines.values():
+                    spine.set_color('white')
+                ax.title.set_color('white')
+                ax.xaxis.label.set_color('white')
+                ax.yaxis.label.set_color('white')
+
+                from matplotlib.colors import PowerNorm
+                freq_arg = freq if scale_y else np.arange(0, len(freq))
+                cmap = matplotlib_cmap(low_color, high_color)
+                ax.pcolormesh(time, freq_arg, magspec, cmap=cmap, norm=PowerNorm(gamma=powernorm))
+
+                ax.set_xlabel('Time (seconds)')
+                ax.set_ylabel('Frequency (Hz)')
+
+                if not scale_y:
+                    indices = np.linspace(0, len(freq)-1, num=10, endpoint=True, dtype=int)
+                    ax.set_yticks(indices, np.round(freq[indices]).astype(int))
+
+            super().__init__(matplotlib_image(draw, 4*aspect_ratio, 4))
+            self.axes = None
+            return
+
+        width = height * aspect_ratio
+        size = (
+            max(1, math.ceil(width * config['pixel_width'] / config['frame_width'])),
+            max(1, math.ceil(height * config['pixel_height'] / config['frame_height'])),
         )
+        super().__init__(colormap_image(magspec, low_color, high_color, gamma=powernorm, size=size))
+        self.stretch_to_fit_width(width)
+        self.stretch_to_fit_height(height)
 
-        # fig = plt.figure(frameon=False)
-        # ax = fig.add_axes((0.1,0.1,0.9,0.9))
-        # # ax = fig.add_axes()
-        # ax.set_axis_off()
-        fig, ax = plt.subplots()
-        fig.set_size_inches(4*aspect_ratio, 4)
-
-        # fig.patch.set_facecolor('black')
-        # ax.set_facecolor('black')
-        fig.patch.set_alpha(0)       # Transparent figure background
-        ax.set_facecolor('none')     # Transparent axes background
-
-        # Set axes spines, ticks, and labels to white
-        ax.tick_params(colors='white')
-        for spine in ax.spines.values():
-            spine.set_color('white')
-        ax.title.set_color('white')
-        ax.xaxis.label.set_color('white')
-        ax.yaxis.label.set_color('white')
-
-        if not scale_y:
-            freq_arg = np.arange(0, len(freq))
+        duration = float(time[-1] - time[0]) if len(time) > 1 else 1.
+        if scale_y:
+            y_range = [float(freq[0]), float(freq[-1]), _nice_step(float(freq[-1] - freq[0]) or 1.)]
         else:
-            freq_arg = freq
-        ax.pcolormesh(time, freq_arg, magspec, cmap=cmap, norm=PowerNorm(gamma=powernorm))
-
-        ax.set_xlabel('Time (seconds)')
-        ax.set_ylabel('Frequency (Hz)')
-
-        if not scale_y:
-            indices = np.linspace(0, len(freq)-1, num=10, endpoint=True, dtype=int)
-            ax.set_yticks(indices, np.round(freq[indices]).astype(int))
-            plt.savefig('mel_output.png')
-
-        fig.tight_layout(pad=0)
-
-        canvas = FigureCanvasAgg(fig)
-        canvas.draw()
-        width, height = canvas.get_width_height()
-        argb = np.frombuffer(canvas.tostring_argb(), dtype=np.uint8).reshape((height, width, 4))
-        rgba = argb[:, :, [1, 2, 3, 0]]
-        plt.close(fig)
-
-        super().__init__(rgba)
+            # ten ticks on bin indices, labelled with their frequency
+            y_range = [0, len(freq)-1, max(len(freq)-1, 1) / 9]
+        axes = Axes(
+            x_range=[float(time[0]), float(time[0]) + duration, _nice_step(duration)],
+            y_range=y_range,
+            x_length=width,
+            y_length=height,
+            tips=False,
+            axis_config={'font_size': 20},
+        )
+        if scale_y:
+            axes.add_coordinates()
+        else:
+            axes.add_coordinates(None, {
+                float(i): Integer(int(round(np.interp(i, np.arange(len(freq)), freq))), font_size=20)
+                for i in np.linspace(0, len(freq)-1, num=10)
+            })
+        axes.shift(self.get_corner(DL) - axes.c2p(float(time[0]), y_range[0]))
+        x_label = axes.get_x_axis_label(Tex('Time (seconds)', font_size=24), DOWN, DOWN, buff=MED_SMALL_BUFF)
+        y_label = axes.get_y_axis_label(Tex('Frequency (Hz)', font_size=24).rotate(PI/2), LEFT, LEFT, buff=MED_SMALL_BUFF)
+        axes.add(x_label, y_label)
+        self.axes = axes
+        self.add(axes)
 
     @classmethod
     def from_audio(
@@ -402,7 +552,7 @@ class Spectrogram(ImageMobject):
             audio = audio.mean(0)
         if normalize:
             audio = audio / abs(audio).max()
-        _, _, spec = scipy.signal.stft(
+        freq, time, spec = scipy.signal.stft(
             audio,
             sr,
             nperseg=window_size,
@@ -412,6 +562,8 @@ class Spectrogram(ImageMobject):
             # padded=False,
         )
         return cls(
+            time,
+            freq,
             spec,
             # square_size=square_size,
             low_color=low_color,
@@ -421,6 +573,5 @@ class Spectrogram(ImageMobject):
 
     @classmethod
     def from_wavfile(cls, file, n_fft, window_size, hop_size, normalize=True):
-        sr, audio = scipy.io.wavfile.read(file)
-        audio = audio.T # scipy -_-
-        return cls.from_audio(audio, sr, n_fft, window_size, hop_size, normalize=normalize)
\ No newline at end of file
+        source = WavSource(file)
+        return cls.from_audio(source.mono(normalize=normalize), source.sr, n_fft, window_size, hop_size, normalize=False)
\ No newline at end of file
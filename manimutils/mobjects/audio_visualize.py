@@ -4,6 +4,8 @@ import scipy.signal
 import scipy
 import librosa
 
+from manimutils.audio_source import WavSource
+
 class AudioVisualizer(VDict):
 
     def __init__(self, audio: np.ndarray, sr: int, n_bands: int):
@@ -109,11 +111,13 @@ class AudioVisualizer(VDict):
 
     @classmethod
     def from_wavfile(cls, audio_file, n_bands: int):
-        sr, audio = scipy.io.wavfile.read(audio_file)
-        audio: np.ndarray = audio.T # scipy -_-
-        audio = audio.astype(float) / audio.max()
+        source = WavSource(audio_file)
+        # same scaling as before WavSource: by the largest (signed) sample
+        # across channels, then downmixed
+        audio = source.as_float32()
+        audio = audio / audio.max()
         if audio.ndim > 1:
-            audio = audio.mean(0)
+            audio = audio.mean(1)
         # audio = audio[:int(sr)]
-        return cls(audio, sr, n_bands)
+        return cls(audio, source.sr, n_bands)
 
@@ -0,0 +1,112 @@
+from manim import *
+import manim
+import json
+import os
+from pathlib import Path
+from hashlib import md5
+
+
+def highlight_code(code_path, formatter_style='monokai', tab_width=4):
+    """Lines of `code_path` and the `(start, end, color)` character ranges to color on each.
+
+    Results are cached in the media directory, keyed by the file's contents
+    and the style, so pygments only runs when the file or style changes.
+    """
+    code_path = Path(code_path)
+    contents = code_path.read_bytes()
+    key = md5(contents)
+    key.update(f':{code_path.name}:{formatter_style}:{tab_width}'.encode('utf-8'))
+    cache_dir = Path(manim.config.media_dir) / 'code'
+    cache_file = cache_dir / (key.hexdigest() + '.json')
+    try:
+        with open(cache_file) as f:
+            cached = json.load(f)
+        return cached['lines'], cached['colors']
+    except (OSError, ValueError, KeyError):
+        pass
+
+    from pygments.lexers import guess_lexer_for_filename
+    from pygments.styles import get_style_by_name
+    code_string = contents.decode('utf-8').expandtabs(tabsize=tab_width)
+    lexer = guess_lexer_for_filename(code_path.name, code_string)
+    style = get_style_by_name(formatter_style)
+    lines = ['']
+    colors = [[]]
+    for token_type, value in lexer.get_tokens(code_string):
+        color = style.style_for_token(token_type)['color']
+        for i, part in enumerate(value.split('\n')):
+            if i > 0:
+                lines.append('')
+                colors.append([])
+            if part and color is not None:
+                start = len(lines[-1])
+                colors[-1].append((start, start + len(part), '#' + color))
+            lines[-1] += part
+    # the lexer always ends with a newline
+    while len(lines) > 1 and lines[-1] == '':
+        lines.pop()
+        colors.pop()
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_suffix('.tmp')
+    with open(tmp_file, 'w') as f:
+        json.dump({'lines': lines, 'colors': colors}, f)
+    os.replace(tmp_file, cache_file)
+    return lines, colors
+
+
+class CodeListing(VGroup):
+    """Same layout as manim's `Code`, but built from `highlight_code`.
+
+    Lines and line numbers are in `code_lines` and `line_numbers`, one
+    submobject per line, so ranges of lines can be highlighted or revealed
+    on a single instance.
+    """
+
+    def __init__(
+        self,
+        code_path,
+        formatter_style='monokai',
+        tab_width=4,
+        add_line_numbers=True,
+        background='rectangle',
+        background_config=None,
+        paragraph_config=None,
+    ):
+        super().__init__()
+        lines, colors = highlight_code(code_path, formatter_style, tab_width)
+        self.lines = lines
+        base_paragraph_config = Code.default_paragraph_config.copy()
+        base_paragraph_config.update(paragraph_config or {})
+        self.code_lines = Paragraph(*lines, **base_paragraph_config)
+        for line, color_range in zip(self.code_lines, colors):
+            for start, end, color in color_range:
+                line[start:end].set_color(color)
+        if add_line_numbers:
+            base_paragraph_config.update({'alignment': 'right'})
+            self.line_numbers = Paragraph(*[str(i) for i in range(1, len(lines) + 1)], **base_paragraph_config)
+            self.line_numbers.next_to(self.code_lines, direction=LEFT).align_to(self.code_lines, UP)
+            self.add(self.line_numbers)
+        else:
+            self.line_numbers = None
+        self.add(self.code_lines)
+        if background == 'rectangle':
+            config = Code.default_background_config.copy()
+            config.update(background_config or {})
+            self.background = SurroundingRectangle(self, **config)
+            self.add_to_back(self.background)
+        else:
+            self.background = None
+
+    def line_group(self, start, end):
+        """Lines `start` to `end` (1-based, inclusive) with their line numbers"""
+        group = VGroup(*self.code_lines[start-1:end])
+        if self.line_numbers is not None:
+            group.add(*self.line_numbers[start-1:end])
+        return group
+
+    def set_line_opacity(self, line, opacity):
+        self.code_lines[line-1].set_opacity(opacity)
+        if self.line_numbers is not None:
+            self.line_numbers[line-1].set_opacity(opacity)
+        return self
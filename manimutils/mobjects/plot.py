@@ -1,7 +1,71 @@
 from manim import *
+import math
 import numpy as np
 from typing import MutableSequence, Sequence, Iterable, Any
 
+def colormap_lut(low_color, high_color, n=256):
+    """`n`x4 uint8 RGBA table going linearly from `low_color` to `high_color`"""
+    low = np.array(ManimColor(low_color).to_rgba())
+    high = np.array(ManimColor(high_color).to_rgba())
+    t = np.linspace(0, 1, n)[:, None]
+    return np.round(255 * ((1 - t) * low + t * high)).astype(np.uint8)
+
+def colormap_image(matrix, low_color=WHITE, high_color=ManimColor('#000082'), gamma=1., vmin=None, vmax=None, size=None):
+    """RGBA image of `matrix` through a 256-entry color table, the way
+    `pcolormesh` with a `PowerNorm(gamma)` would draw it (row 0 at the bottom).
+
+    `size` is the (width, height) in pixels to resample to (nearest neighbour),
+    e.g. the on-screen footprint.
+    """
+    values = np.asarray(matrix, dtype=np.float32)
+    vmin = float(values.min()) if vmin is None else vmin
+    vmax = float(values.max()) if vmax is None else vmax
+    if vmax > vmin:
+        normed = np.clip((values - vmin) / (vmax - vmin), 0, 1)
+    else:
+        normed = np.zeros_like(values)
+    if gamma != 1:
+        normed **= gamma
+    # same binning as matplotlib colormaps
+    indices = np.minimum((normed * 256).astype(np.uint16), 255)
+    if size is not None:
+        width, height = size
+        rows = np.arange(height) * values.shape[0] // height
+        cols = np.arange(width) * values.shape[1] // width
+        indices = indices[rows[:, None], cols[None, :]]
+    return colormap_lut(low_color, high_color)[indices[::-1]]
+
+def matplotlib_image(draw, width, height):
+    """RGBA image of a transparent matplotlib figure of `width` x `height` inches,
+    with `draw(fig, ax)` doing the plotting"""
+    from matplotlib import pyplot as plt
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    fig, ax = plt.subplots()
+    fig.set_size_inches(width, height)
+    fig.patch.set_alpha(0)       # Transparent figure background
+    ax.set_facecolor('none')     # Transparent axes background
+    draw(fig, ax)
+    fig.tight_layout(pad=0)
+    canvas = FigureCanvasAgg(fig)
+    canvas.draw()
+    width, height = canvas.get_width_height()
+    argb = np.frombuffer(canvas.tostring_argb(), dtype=np.uint8).reshape((height, width, 4))
+    rgba = argb[:, :, [1, 2, 3, 0]]
+    plt.close(fig)
+    return rgba
+
+def matplotlib_cmap(low_color, high_color):
+    from matplotlib.colors import LinearSegmentedColormap
+    return LinearSegmentedColormap.from_list(
+        'WhBu',
+        [
+            ManimColor(low_color).to_rgba(),
+            ManimColor(high_color).to_rgba()
+        ],
+        N=256,
+        gamma=1.0
+    )
+
 class BetterAxes(Axes):
 
     def __init__(
@@ -96,47 +160,32 @@ class BetterAxes(Axes):
         matrix,
         low_color: ParsableManimColor = WHITE,
         high_color: ParsableManimColor = ManimColor('#000082'),
-        plot_kwargs={}
+        plot_kwargs={},
+        powernorm=1.,
     ):
-        from matplotlib import pyplot as plt
-        from matplotlib.colors import LinearSegmentedColormap
-        from matplotlib.backends.backend_agg import FigureCanvasAgg
-
-        cmap = LinearSegmentedColormap.from_list(
-            'WhBu',
-            [
-                low_color.to_rgba(),
-                high_color.to_rgba()
-            ],
-            N=256,
-            gamma=1.0
-        )
-
+        """Image of `matrix` filling the axes. `plot_kwargs` are passed to
+        matplotlib's `pcolormesh`, and giving any switches to drawing with
+        matplotlib instead of the color table"""
         plain_x_axis = self.x_axis.copy()
         plain_x_axis.submobjects = []
 
-        fig, ax = plt.subplots()
-        fig.set_size_inches(self.x_axis.get_length(), self.y_axis.get_length())
-        ax.set_axis_off()
-
-        fig.patch.set_alpha(0)       # Transparent figure background
-        ax.set_facecolor('none')     # Transparent axes background
-        ax.pcolormesh(matrix, cmap=cmap, **plot_kwargs)
-        fig.tight_layout(pad=0)
-        canvas = FigureCanvasAgg(fig)
-        canvas.draw()
-        width, height = canvas.get_width_height()
-        argb = np.frombuffer(canvas.tostring_argb(), dtype=np.uint8).reshape((height, width, 4))
-        rgba = argb[:, :, [1, 2, 3, 0]]
-        plt.close(fig)
+        if plot_kwargs:
+            def draw(fig, ax):
+                ax.set_axis_off()
+                ax.pcolormesh(matrix, cmap=matplotlib_cmap(low_color, high_color), **plot_kwargs)
+            rgba = matplotlib_image(draw, self.x_axis.get_length(), self.y_axis.get_length())
+        else:
+            size = (
+                max(1, math.ceil(self.x_axis.get_length() * config['pixel_width'] / config['frame_width'])),
+                max(1, math.ceil(self.y_axis.get_length() * config['pixel_height'] / config['frame_height'])),
+            )
+            rgba = colormap_image(matrix, low_color, high_color, gamma=powernorm, size=size)
 
         img = ImageMobject(rgba)
 
-        
-
         img.scale_to_fit_width(plain_x_axis.get_length())
         img.move_to(plain_x_axis, aligned_edge=DOWN)
 
         img.set_z_index(self.z_index-1)
 
-        return img
\ No newline at end of file
+        return img
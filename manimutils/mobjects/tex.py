@@ -78,4 +78,32 @@ class BetterMathTex(MathTex):
 class Footnote(Tex): # Is this scuffed? eh...
     
     def __init__(self, tex_string, arg_separator="", tex_environment="center", **kwargs):
-        super().__init__(r'\mbox{' + tex_string + '}', arg_separator=arg_separator, tex_environment=tex_environment, **kwargs)
\ No newline at end of file
+        super().__init__(r'\mbox{' + tex_string + '}', arg_separator=arg_separator, tex_environment=tex_environment, **kwargs)
+
+
+class GlyphCounter:
+    """Builds lookalikes of `MathTex(prefix + str(n))` from glyphs compiled once.
+
+    Digits in math mode all have the same advance width, so a number can be
+    laid out by shifting copies of the digit glyphs from a single reference
+    compilation instead of running LaTeX for every new number.
+    """
+
+    def __init__(self, prefix='', **kwargs):
+        # the trailing 0 measures the advance width over ten digits
+        reference = MathTex(prefix + '01234567890', **kwargs)
+        glyphs = reference.family_members_with_points()
+        n_prefix = len(glyphs) - 11
+        assert n_prefix >= 0, 'could not find the digit glyphs in the reference'
+        self.prefix = glyphs[:n_prefix]
+        self.digits = glyphs[n_prefix:n_prefix+10]
+        self.advance = (glyphs[-1].get_left()[0] - self.digits[0].get_left()[0]) / 10
+
+    def __call__(self, number: int) -> VGroup:
+        assert number >= 0
+        glyphs = [glyph.copy() for glyph in self.prefix]
+        for i, digit in enumerate(map(int, str(number))):
+            # move the glyph from its cell in the reference to cell i
+            glyphs.append(self.digits[digit].copy().shift((i - digit) * self.advance * RIGHT))
+        # same nesting as MathTex, so Transforms between them line up
+        return VGroup(VGroup(*glyphs))
@@ -0,0 +1,155 @@
+from manim import *
+import numpy as np
+from pathlib import Path
+from collections import OrderedDict
+
+
+class VideoReader:
+    """Decodes frames of a video file (or a `.npy` array of frames, which is
+    memory-mapped) on demand, keeping at most `cache_size` of them in memory.
+
+    Frames are RGBA uint8, resized to fit in `max_size` (width, height)
+    pixels if given.
+    """
+
+    # decode forward instead of seeking if the target is at most this many frames ahead
+    seek_threshold = 48
+
+    def __init__(self, source, fps=None, max_size=None, cache_size=32):
+        self.source = Path(source)
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._last = None
+        if self.source.suffix == '.npy':
+            assert fps is not None, 'fps is required for frame sequences'
+            self.frames = np.load(self.source, mmap_mode='r')
+            self.fps = float(fps)
+            self.num_frames = len(self.frames)
+            native_height, native_width = self.frames.shape[1:3]
+            self.container = None
+        else:
+            import av
+            self.frames = None
+            self.container = av.open(str(self.source))
+            self.stream = self.container.streams.video[0]
+            self.stream.thread_type = 'AUTO'
+            self.fps = float(fps or self.stream.average_rate)
+            self.start_time = float(self.stream.start_time * self.stream.time_base) if self.stream.start_time else 0.
+            if self.stream.frames:
+                self.num_frames = self.stream.frames
+            elif self.stream.duration:
+                self.num_frames = int(float(self.stream.duration * self.stream.time_base) * self.fps)
+            else:
+                self.num_frames = int(self.container.duration / av.time_base * self.fps)
+            native_width, native_height = self.stream.width, self.stream.height
+            self._decoder = None
+            self._next_index = 0
+        self.size = (native_width, native_height)
+        if max_size is not None:
+            scale = min(1., max_size[0] / native_width, max_size[1] / native_height)
+            self.size = (max(1, round(native_width * scale)), max(1, round(native_height * scale)))
+
+    def __deepcopy__(self, memo):
+        # copies of the mobject share the decoder and its cache
+        return self
+
+    def __len__(self):
+        return self.num_frames
+
+    @property
+    def duration(self):
+        return self.num_frames / self.fps
+
+    def _store(self, index, array):
+        self._cache[index] = array
+        self._cache.move_to_end(index)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        self._last = array
+
+    def _from_array(self, array):
+        from PIL import Image
+        image = Image.fromarray(np.asarray(array)).convert('RGBA')
+        if image.size != self.size:
+            image = image.resize(self.size, Image.Resampling.BILINEAR)
+        return np.asarray(image)
+
+    def _decode(self, index):
+        seek = (
+            self._decoder is None
+            or index < self._next_index
+            or index > self._next_index + self.seek_threshold
+        )
+        if seek:
+            if index > 0:
+                target = int((index / self.fps + self.start_time) / self.stream.time_base)
+                self.container.seek(target, stream=self.stream)
+            else:
+                self.container.seek(0)
+            self._decoder = self.container.decode(self.stream)
+        for frame in self._decoder:
+            if frame.time is not None:
+                i = round((frame.time - self.start_time) * self.fps)
+            else:
+                i = self._next_index
+            self._next_index = i + 1
+            if i < index:
+                continue
+            array = frame.to_ndarray(format='rgba', width=self.size[0], height=self.size[1])
+            self._store(i, array)
+            return array
+        # past the end, hold the last frame
+        self._decoder = None
+        return self._last
+
+    def frame(self, index):
+        index = int(np.clip(index, 0, self.num_frames - 1))
+        if index in self._cache:
+            self._cache.move_to_end(index)
+            return self._cache[index]
+        if self.frames is not None:
+            array = self._from_array(self.frames[index])
+            self._store(index, array)
+            return array
+        return self._decode(index)
+
+    def frame_at(self, time):
+        return self.frame(int(time * self.fps))
+
+
+class VideoMobject(ImageMobject):
+    """Image mobject showing a video, decoded lazily as `tracker` advances,
+    so memory use does not depend on the length of the clip"""
+
+    def __init__(self, source, fps=None, max_size=None, cache_size=32, **kwargs):
+        self.reader = VideoReader(source, fps=fps, max_size=max_size, cache_size=cache_size)
+        self.frame_index = 0
+        # copies, since ImageMobject may change pixels in place (e.g. `set_opacity`)
+        super().__init__(self.reader.frame(0).copy(), **kwargs)
+        self.tracker = ValueTracker(0.)
+        self.duration_in_seconds = self.reader.duration
+        self.add_updater(self._updater)
+
+    def _updater(self, m):
+        m.seek(m.tracker.get_value())
+        return m
+
+    def seek(self, time):
+        index = int(np.clip(int(time * self.reader.fps), 0, len(self.reader) - 1))
+        if index != self.frame_index:
+            pixel_array = self.reader.frame(index).copy()
+            # the new frame would otherwise undo `set_opacity` and fades
+            if self.fill_opacity < 1:
+                pixel_array[:, :, 3] = pixel_array[:, :, 3] * self.fill_opacity
+            self.pixel_array = pixel_array
+            self.frame_index = index
+        return self
+
+    def play(self, start=0., end=None):
+        if end is None:
+            end = self.duration_in_seconds
+        self.tracker.set_value(start)
+        return AnimationGroup(
+            self.tracker.animate.set_value(end).build().set_rate_func(rate_functions.linear),
+            run_time=end - start
+        )
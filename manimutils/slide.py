@@ -1,11 +1,17 @@
+import os
+import math
 from pathlib import Path
+from hashlib import md5
 
 from manim import *
 import manim
 from manim_slides import Slide
 from manim_slides.slide.animation import Wipe
-from manimutils import AudioSlide
-from .mobjects.tex import Footnote
+from manim.animation.animation import prepare_animation
+from .audioslide import AudioSlide
+from .mobjects.tex import Footnote, GlyphCounter
+from .mobjects.code import CodeListing, highlight_code
+from .tex_cache import compile_tex_batch, modified_expression
 
 
 tex_preamble = r"""
@@ -41,12 +47,195 @@ def scale_to_fit(mobject, width, height):
     scale_factor = min(width_ratio, height_ratio)
     return mobject.scale(scale_factor)
 
-def scale_to_fit_region(mobject, region: Rectangle):
+def scale_to_fit_region(mobject, region: Mobject):
     return scale_to_fit(mobject, region.width, region.height)
 
+class Region(Mobject):
+    """Axis-aligned box used for layout, much cheaper to build and copy than a `Rectangle`"""
+
+    def __init__(self, width=1., height=1., **kwargs):
+        self.region_size = (width, height)
+        super().__init__(**kwargs)
+
+    def generate_points(self):
+        width, height = self.region_size
+        self.points = np.array([
+            [-width/2, -height/2, 0.],
+            [width/2, -height/2, 0.],
+            [width/2, height/2, 0.],
+            [-width/2, height/2, 0.],
+        ])
+
+    def copy(self):
+        region = Region()
+        region.points = self.points.copy()
+        return region
+
+    def to_rectangle(self, **kwargs):
+        """Drawable version of this region"""
+        return Rectangle(width=self.width, height=self.height, **kwargs).move_to(self.get_center())
+
+def rasterize_mobjects(*mobjects):
+    """Full-frame bitmap of `mobjects` on a transparent background"""
+    camera = Camera(background_opacity=0.)
+    camera.capture_mobjects(list(mobjects))
+    image = ImageMobject(camera.pixel_array)
+    image.stretch_to_fit_width(manim.config['frame_width'])
+    image.stretch_to_fit_height(manim.config['frame_height'])
+    image.move_to(camera.frame_center)
+    # manim only hashes the first 10000 values of big arrays (the top rows of
+    # the bitmap, usually transparent) for the partial movie cache, this makes
+    # the bitmap's hash depend on what it shows
+    image.source_key = mobjects_state_key(mobjects, pixels=True)
+    return image
+
+class RasterizedWipe(AnimationGroup):
+    """`Wipe` whose incoming side is a bitmap (unless it has updaters),
+    the real mobjects are swapped in once the animation is done"""
+
+    def __init__(self, current, future, **kwargs):
+        if not isinstance(future, (list, tuple)):
+            future = [future]
+        self.future = list(future)
+        self.future_image = None
+        if self.future and not any(m.updaters for mob in self.future for m in mob.get_family()):
+            self.future_image = rasterize_mobjects(*self.future)
+            future = [self.future_image]
+        super().__init__(Wipe(current, future, **kwargs))
+
+    def clean_up_from_scene(self, scene):
+        super().clean_up_from_scene(scene)
+        if self.future_image is not None:
+            scene.remove(self.future_image)
+            scene.add(*self.future)
+
+def downsampled_image(image_path, max_width, max_height):
+    """Path to a copy of `image_path` resized to fit `max_width` x `max_height` pixels.
+
+    Copies are cached in the media directory, keyed by path, modification
+    time and target size. Returns `image_path` itself if it is already small
+    enough.
+    """
+    from PIL import Image
+    image_path = Path(image_path)
+    with Image.open(image_path) as image:
+        width, height = image.size
+        scale = min(max_width / width, max_height / height)
+        if scale >= 1:
+            return image_path
+        size = (max(1, round(width * scale)), max(1, round(height * scale)))
+        stat = image_path.stat()
+        key = f'{image_path.resolve()}:{stat.st_mtime_ns}:{size[0]}x{size[1]}'
+        suffix = '.jpg' if image.format == 'JPEG' else '.png'
+        cache_dir = Path(manim.config.media_dir) / 'downsampled_images'
+        cache_file = cache_dir / (md5(key.encode('utf-8')).hexdigest() + suffix)
+        if not cache_file.exists():
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            resized = image.resize(size, Image.Resampling.LANCZOS)
+            tmp_file = cache_file.with_suffix('.tmp' + suffix)
+            if suffix == '.jpg':
+                resized.save(tmp_file, quality=95)
+            else:
+                resized.save(tmp_file)
+            os.replace(tmp_file, cache_file)
+    return cache_file
+
+def mobjects_state_key(mobjects, pixels=False):
+    """Hash of the geometry and colors of `mobjects` and their families.
+
+    Images are identified by their pixel array object unless `pixels`, which
+    hashes their contents and gives a key that is stable across renders.
+    """
+    h = md5()
+    for mobject in mobjects:
+        for m in mobject.get_family():
+            h.update(m.points.tobytes())
+            for attr in ('fill_rgbas', 'stroke_rgbas'):
+                value = getattr(m, attr, None)
+                if value is not None:
+                    h.update(np.ascontiguousarray(value).tobytes())
+            if isinstance(m, AbstractImageMobject):
+                pixel_array = m.get_pixel_array()
+                if pixels:
+                    h.update(np.ascontiguousarray(pixel_array).tobytes())
+                else:
+                    # hashing the pixels of big images every frame would defeat the purpose
+                    h.update(str((id(pixel_array), pixel_array.shape)).encode('utf-8'))
+    return h.hexdigest()
+
+def _split_bullets(bullets):
+    """Bullet strings of `CustomSlide.bullets`, with the colors, shapes and footnotes mixed in taken out"""
+    bullets = list(bullets)
+    colors = {}
+    shapes = {}
+    footnote_map = {}
+    i = 0
+    while i < len(bullets):
+        bullet = bullets[i]
+        if isinstance(bullet, ManimColor):
+            colors[i] = bullet
+            del bullets[i]
+        elif isinstance(bullet, Footnote):
+            num = len(footnote_map)+1
+            mark_tex = r'\textsuperscript{' + str(num) + '}'
+            del bullets[i]
+            assert i > 0, 'First object cannot be a footnote (that doesn\'t even make sense!)'
+            bullets[i-1] = bullets[i-1] + mark_tex
+            footnote_map[i-1] = mark_tex + bullet.tex_string
+        elif isinstance(bullet, VMobject):
+            shapes[i] = bullet
+            del bullets[i]
+        else:
+            i += 1
+
+    indentation = []
+    for i in range(0, len(bullets)):
+        indentation.append(0)
+        while bullets[i].startswith('\t'):
+            bullets[i] = bullets[i][1:]
+            indentation[i] += 1
+        bullets[i] = bullets[i].replace('\n', '\\\\')
+    return bullets, indentation, colors, shapes, footnote_map
+
+
+def bullet_tex_strings(*bullets):
+    """Tex strings compiled by `CustomSlide.bullets(*bullets)`.
+
+    Returns the strings of the `BulletedList` (the whole list, then each
+    item, all without an environment) and those of the footnotes (which
+    `Footnote` wraps in an mbox, in the center environment).
+    """
+    items, _, _, _, footnote_map = _split_bullets(bullets)
+    items = [item + '\\\\' for item in items]
+    return [''.join(items), *items], list(footnote_map.values())
+
+
+def _canvas_updates(animations):
+    """`canvas_update` of each of `animations` and of the animations they group"""
+    for anim in animations:
+        # _AnimationBuilder (`.animate`) would turn any attribute into a method call
+        if isinstance(anim, Animation):
+            yield from _canvas_updates(getattr(anim, 'animations', []))
+            if hasattr(anim, 'canvas_update'):
+                yield anim.canvas_update
+
+
 tex_template = TexTemplate(preamble=tex_preamble)
 class CustomSlide(AudioSlide):
     name: str = None
+    # How bullet_slide and bullet_image_slide reveal each bullet:
+    # 'animate' fades it in, 'static' just shows it for a single frame
+    bullet_reveal: str = 'animate'
+    # Wipe bitmaps of the outgoing/incoming slides instead of the mobjects
+    # themselves, so transitions cost the same regardless of slide complexity
+    # (always done in draft builds)
+    rasterize_transitions: bool = False
+    # Only render deck slides `start` to `stop` (inclusive), given as indices
+    # (counted by `transition`, like slide numbers) or slide titles. Other
+    # slides still run through `construct` so the canvas stays consistent, but
+    # are not rendered, and keep their entries in the existing presentation file.
+    # Can be set from the command line with MANIMUTILS_RENDER_SLIDES=start:stop
+    render_slides: tuple | None = None
 
     def __str__(self):
         if self.name is not None:
@@ -54,19 +243,174 @@ class CustomSlide(AudioSlide):
         else:
             return super().__str__()
 
+    def render(self, *args, **kwargs):
+        self._init_render_range()
+        return super().render(*args, **kwargs)
+
+    def _init_render_range(self):
+        render_slides = self.render_slides
+        if env := os.environ.get('MANIMUTILS_RENDER_SLIDES'):
+            start, _, stop = env.partition(':')
+            render_slides = tuple(int(x) if x.isdigit() else x for x in (start, stop or start))
+        if isinstance(render_slides, (int, str)):
+            render_slides = (render_slides, render_slides)
+        self._render_range = render_slides
+        self._deck_slide = 0
+        # first and last deck slides rendered, for merging into the presentation file
+        self._rendered_decks = None if render_slides is None else (None, None)
+        self._next_slide_name = None
+        self._render_range_state = 'inside'
+        self._render_range_at_stop = False
+        self._skipping_slide = False
+        self._user_skipped_slide = False
+        if self._render_range is not None:
+            self._render_range_state = 'before'
+            self._advance_render_range(None)
+
+    def _advance_render_range(self, name):
+        start, stop = self._render_range
+        matches = lambda key: key == self._deck_slide or (name is not None and key == name)
+        if self._render_range_state == 'inside' and self._render_range_at_stop:
+            self._render_range_state = 'after'
+        if self._render_range_state == 'before' and matches(start):
+            self._render_range_state = 'inside'
+        if self._render_range_state == 'inside':
+            self._render_range_at_stop = matches(stop)
+            first, _ = self._rendered_decks
+            self._rendered_decks = (self._deck_slide if first is None else first, self._deck_slide)
+        skip = self._render_range_state != 'inside'
+        if (
+            skip != self._skipping_slide
+            and self._current_animation == self._start_animation
+            and not self.__dict__.get('_user_skipped_slide', False)
+        ):
+            # `next_slide(skip_animations=...)` applies to the slide it opens,
+            # which is the one the wipe of `transition` plays in, so that slide
+            # (still empty) is switched here rather than at the next `next_slide`
+            skip_animations = skip or self._skip_animations
+            self._base_slide_config.skip_animations = skip_animations
+            Scene.next_section(self, skip_animations=skip_animations)
+            self._skipping_slide = skip
+
+    @property
+    def _outside_render_range(self):
+        return self.__dict__.get('_render_range') is not None and self._render_range_state != 'inside'
+
+    def _rendered_deck_slides(self):
+        return self.__dict__.get('_rendered_decks')
+
+    def next_slide(self, *args, **kwargs):
+        user_skipped = kwargs.get('skip_animations', False)
+        if self._outside_render_range:
+            kwargs['skip_animations'] = True
+        n_slides = len(self._slides)
+        super().next_slide(*args, **kwargs)
+        if len(self._slides) > n_slides:
+            self._slides[n_slides].__dict__['deck_slide'] = self.__dict__.get('_deck_slide', 0)
+        self._skipping_slide = self._outside_render_range and not user_skipped
+        self._user_skipped_slide = user_skipped
+
+    def _add_last_slide(self):
+        n_slides = len(self._slides)
+        super()._add_last_slide()
+        if len(self._slides) > n_slides:
+            self._slides[n_slides].__dict__['deck_slide'] = self.__dict__.get('_deck_slide', 0)
+
+    def prefetch_tex(self, *tex_strings, environment='center', tex_template=None, max_workers=None):
+        """Compile `tex_strings` in parallel so that building them later hits manim's tex cache.
+
+        The default environment matches `Tex`, use 'align*' for `MathTex`.
+        """
+        compile_tex_batch(
+            [(modified_expression(tex_string), environment, tex_template) for tex_string in tex_strings],
+            max_workers=max_workers,
+        )
+
+    def prefetch_bullets(self, *bullet_lists, tex_template=None, max_workers=None):
+        """Compile the Tex of `self.bullets(*bullets)` for each of `bullet_lists` in parallel"""
+        requests = [(modified_expression(r'\cdot'), 'align*', tex_template)]
+        for bullets in bullet_lists:
+            items, footnotes = bullet_tex_strings(*bullets)
+            requests += [(modified_expression(item), None, tex_template) for item in items]
+            requests += [(modified_expression(r'\mbox{' + footnote + '}'), 'center', tex_template) for footnote in footnotes]
+        compile_tex_batch(requests, max_workers=max_workers)
+
+    def freeze(self, *mobjects):
+        """Draw `mobjects` once into a bitmap at the back of the scene.
+
+        The bitmap is redrawn before a `play` if the mobjects were changed
+        since, and they are temporarily put back for any `play` that
+        animates them. Updaters of frozen mobjects do not run. The next
+        `transition` (or `thaw`) puts the real mobjects back.
+        """
+        self.thaw()
+        # The scene only holds the bitmap while frozen, so the partial movie
+        # hash of every play depends on the frozen content through the key
+        # `rasterize_mobjects` stores on it
+        image = rasterize_mobjects(*mobjects)
+        self.remove(*mobjects)
+        self.add(image)
+        self.bring_to_back(image)
+        self._frozen_layer = (list(mobjects), image, mobjects_state_key(mobjects))
+        return image
+
+    def thaw(self):
+        layer = self.__dict__.pop('_frozen_layer', None)
+        if layer is None:
+            return
+        mobjects, image, _ = layer
+        if image in self.mobjects:
+            index = self.mobjects.index(image)
+            self.mobjects[index:index+1] = mobjects
+        else:
+            self.add(*mobjects)
+
+    def play(self, *args, **kwargs):
+        for canvas_update in _canvas_updates(args):
+            self.add_to_canvas(**canvas_update)
+        layer = self.__dict__.get('_frozen_layer')
+        if layer is None:
+            return super().play(*args, **kwargs)
+        mobjects, _, key = layer
+        args = [prepare_animation(anim) for anim in args]
+        frozen = {id(m) for mobject in mobjects for m in mobject.get_family()}
+        animated = {
+            id(m)
+            for anim in args if anim.mobject is not None
+            for m in anim.mobject.get_family()
+        }
+        if frozen & animated:
+            self.thaw()
+            result = super().play(*args, **kwargs)
+            self.freeze(*mobjects)
+            return result
+        if mobjects_state_key(mobjects) != key:
+            self.freeze(*mobjects)
+        return super().play(*args, **kwargs)
+
     def update_canvas(self):
         if hasattr(self, 'counter'):
             self.counter += 1
             old_slide_number = self.canvas["slide_number"]
-            new_slide_number = MathTex(f"{self.slide_number_prefix}{self.counter}")
+            new_slide_number = self.slide_number_glyphs(self.counter)
             region = self.footer_region(height_ratio=0.05)
             self.scale_to_fit(new_slide_number, region)
             self.center(new_slide_number, region)
             new_slide_number.align_to(region, RIGHT)
-            return Transform(old_slide_number, new_slide_number, run_time=0.25)
+            # Replace rather than transform in place, so the number on screen
+            # (and the partial movie hashes) never carry state over from
+            # previous slides. The canvas is only updated when this is played.
+            anim = ReplacementTransform(old_slide_number, new_slide_number, run_time=0.25)
+            anim.canvas_update = {'slide_number': new_slide_number}
+            return anim
         return Wait(stop_condition=lambda: True)
 
-    def transition(self, future, return_anim=False):
+    def transition(self, future, return_anim=False, rasterize=None):
+        self.thaw()
+        self._deck_slide = self.__dict__.get('_deck_slide', 0) + 1
+        if self.__dict__.get('_render_range') is not None:
+            self._advance_render_range(self._next_slide_name)
+        self._next_slide_name = None
         # Guard against persistent ScreenRectangle in scene
         # (if you don't do this, the transition gets messed up)
         from itertools import chain
@@ -76,7 +420,19 @@ class CustomSlide(AudioSlide):
                 self.remove(all_mobjects[i])
         # current = [m for m in self.mobjects_without_canvas if not isinstance(m, ScreenRectangle)]
         current = self.mobjects_without_canvas
-        anim = Wipe(current, future, run_time=0.5)
+        if rasterize is None:
+            rasterize = self.rasterize_transitions or self.is_draft
+        if rasterize and manim.config.renderer == RendererType.CAIRO:
+            # Swap the outgoing mobjects for their bitmap right away, they
+            # would otherwise still be drawn as part of the static background
+            if current:
+                current_image = rasterize_mobjects(*current)
+                self.remove(*current)
+                self.add(current_image)
+                current = [current_image]
+            anim = RasterizedWipe(current, future, run_time=0.5)
+        else:
+            anim = Wipe(current, future, run_time=0.5)
         anim = AnimationGroup(anim, self.update_canvas())
         if return_anim:
             return anim
@@ -86,72 +442,97 @@ class CustomSlide(AudioSlide):
         for anim in iter(iterator):
             self.play(anim)
 
-    def title_region(self, height_ratio=0.1, side_buffer=None):
+    def _cached_region(self, key, build):
+        # Regions only depend on the frame size and their arguments (and the
+        # slide number footprint, which callers put in `key`), so changing
+        # any of those simply misses the cache
+        cache = self.__dict__.setdefault('_region_cache', {})
+        key = (manim.config['frame_width'], manim.config['frame_height']) + key
+        if key not in cache:
+            cache[key] = build()
+        return cache[key]
+
+    def title_region(self, height_ratio=0.1, side_buffer=None, drawable=False):
         if side_buffer is None:
             side_buffer = DEFAULT_MOBJECT_TO_EDGE_BUFFER
-        width = manim.config['frame_width'] - 2*side_buffer
-        height = manim.config['frame_height'] * height_ratio
-        region = Rectangle(height=height, width=width)
-        region.to_edge(UP)
-        return region
-
-    def footer_region(self, height_ratio=0.075, side_buffer=None, account_for_number=False):
+        def build():
+            width = manim.config['frame_width'] - 2*side_buffer
+            height = manim.config['frame_height'] * height_ratio
+            region = Region(height=height, width=width)
+            region.to_edge(UP)
+            return region
+        region = self._cached_region(('title', height_ratio, side_buffer), build)
+        return region.to_rectangle() if drawable else region.copy()
+
+    def footer_region(self, height_ratio=0.075, side_buffer=None, account_for_number=False, drawable=False):
         if side_buffer is None:
             side_buffer = DEFAULT_MOBJECT_TO_EDGE_BUFFER
-        width = manim.config['frame_width'] - 2*side_buffer
-
-        height = manim.config['frame_height'] * height_ratio
-        region = Rectangle(height=height, width=width)
-        region.to_edge(DOWN, MED_SMALL_BUFF)
-
+        number = None
         if account_for_number and 'slide_number' in self.canvas:
             number = self.canvas['slide_number']
-            right_bound = number.get_left() + DEFAULT_MOBJECT_TO_MOBJECT_BUFFER * LEFT
-            new_width = abs((region.get_left() - right_bound)[0])
-            new_region = region.copy().stretch_to_fit_width(new_width).align_to(region, LEFT)
-            region = new_region
+        def build():
+            width = manim.config['frame_width'] - 2*side_buffer
 
-        return region
+            height = manim.config['frame_height'] * height_ratio
+            region = Region(height=height, width=width)
+            region.to_edge(DOWN, MED_SMALL_BUFF)
 
-    def content_region(self, side_buffer=None, top_buffer=None, bottom_buffer=None):
+            if number is not None:
+                right_bound = number.get_left() + DEFAULT_MOBJECT_TO_MOBJECT_BUFFER * LEFT
+                new_width = abs((region.get_left() - right_bound)[0])
+                new_region = region.copy().stretch_to_fit_width(new_width).align_to(region, LEFT)
+                region = new_region
+
+            return region
+        footprint = None if number is None else tuple(np.round(number.get_left(), 6))
+        region = self._cached_region(('footer', height_ratio, side_buffer, footprint), build)
+        return region.to_rectangle() if drawable else region.copy()
+
+    def content_region(self, side_buffer=None, top_buffer=None, bottom_buffer=None, drawable=False):
         if side_buffer is None:
             side_buffer = DEFAULT_MOBJECT_TO_EDGE_BUFFER
         if bottom_buffer is None:
             bottom_buffer = DEFAULT_MOBJECT_TO_MOBJECT_BUFFER
         if top_buffer is None:
             top_buffer = DEFAULT_MOBJECT_TO_MOBJECT_BUFFER
-        title_region = self.title_region()
-        width = manim.config['frame_width'] - 2*side_buffer
-        footer_region = self.footer_region()
-        # the center of the screen is at (0,0), so the math looks a bit weird when simplified:
-        height = (
-            title_region.get_bottom()[1]
-            - footer_region.get_top()[1]
-            # + manim.config['frame_height']/2
-            - bottom_buffer
-            - top_buffer
-        )
-        region = Rectangle(height=height, width=width)
-        region.next_to(title_region, DOWN, top_buffer)
-        return region
-
-    def half_content_region(self, side=LEFT, middle_buffer=None):
+        def build():
+            title_region = self.title_region()
+            width = manim.config['frame_width'] - 2*side_buffer
+            footer_region = self.footer_region()
+            # the center of the screen is at (0,0), so the math looks a bit weird when simplified:
+            height = (
+                title_region.get_bottom()[1]
+                - footer_region.get_top()[1]
+                # + manim.config['frame_height']/2
+                - bottom_buffer
+                - top_buffer
+            )
+            region = Region(height=height, width=width)
+            region.next_to(title_region, DOWN, top_buffer)
+            return region
+        region = self._cached_region(('content', side_buffer, top_buffer, bottom_buffer), build)
+        return region.to_rectangle() if drawable else region.copy()
+
+    def half_content_region(self, side=LEFT, middle_buffer=None, drawable=False):
         if middle_buffer is None:
             middle_buffer = DEFAULT_MOBJECT_TO_MOBJECT_BUFFER
-        content_region = self.content_region()
-        region = content_region.copy()
-        region.stretch(0.5, 0)
-        buffer_factor = (region.width - middle_buffer/2) / region.width
-        region.stretch(buffer_factor, 0)
-        region.align_to(content_region, side)
-        return region
+        def build():
+            content_region = self.content_region()
+            region = content_region.copy()
+            region.stretch(0.5, 0)
+            buffer_factor = (region.width - middle_buffer/2) / region.width
+            region.stretch(buffer_factor, 0)
+            region.align_to(content_region, side)
+            return region
+        region = self._cached_region(('half_content', tuple(side), middle_buffer), build)
+        return region.to_rectangle() if drawable else region.copy()
 
     def demo_layout(self):
-        title_region = self.title_region()
-        footer_region = self.footer_region()
-        content_region = self.content_region()
-        left_region = self.half_content_region(LEFT)
-        right_region = self.half_content_region(RIGHT)
+        title_region = self.title_region(drawable=True)
+        footer_region = self.footer_region(drawable=True)
+        content_region = self.content_region(drawable=True)
+        left_region = self.half_content_region(LEFT, drawable=True)
+        right_region = self.half_content_region(RIGHT, drawable=True)
         self.play(Succession(
             FadeIn(title_region),
             FadeIn(footer_region),
@@ -162,6 +543,8 @@ class CustomSlide(AudioSlide):
         self.next_slide()
 
     def slide_title(self, title, color=ORANGE):
+        # lets `render_slides` refer to the slide by its title
+        self._next_slide_name = title
         text = Tex(title, color=color)
         region = self.title_region()
         scale_to_fit_region(text, region)
@@ -185,43 +568,12 @@ class CustomSlide(AudioSlide):
         mobject.move_to(region)
 
     def bullets(self, *bullets, scale_factor=1, bullets_region=None):
-        bullets = list(bullets)
-
         if bullets_region is None:
             bullets_region = self.content_region()
 
-        colors = {}
-        shapes = {}
-        footnotes = []
-        footnote_map = {}
-        i = 0
-        while i < len(bullets):
-            bullet = bullets[i]
-            if isinstance(bullet, ManimColor):
-                colors[i] = bullet
-                del bullets[i]
-            elif isinstance(bullet, Footnote):
-                num = len(footnotes)+1
-                mark_tex = r'\textsuperscript{' + str(num) + '}'
-                bullet = Footnote(mark_tex + bullet.tex_string)
-                footnotes.append(bullet)
-                del bullets[i]
-                assert i > 0, 'First object cannot be a footnote (that doesn\'t even make sense!)'
-                bullets[i-1] = bullets[i-1] + mark_tex
-                footnote_map[i-1] = bullet
-            elif isinstance(bullet, VMobject):
-                shapes[i] = bullet
-                del bullets[i]
-            else:
-                i += 1
-
-        indentation = []
-        for i in range(0, len(bullets)):
-            indentation.append(0)
-            while bullets[i].startswith('\t'):
-                bullets[i] = bullets[i][1:]
-                indentation[i] += 1
-            bullets[i] = bullets[i].replace('\n', '\\\\')
+        bullets, indentation, colors, shapes, footnote_map = _split_bullets(bullets)
+        footnote_map = {i: Footnote(footnote) for i, footnote in footnote_map.items()}
+        footnotes = list(footnote_map.values())
 
         bullets = BulletedList(*bullets, buff=MED_SMALL_BUFF)
         bullets.scale(scale_factor)
@@ -272,7 +624,17 @@ class CustomSlide(AudioSlide):
         self.transition(self.in_region(Tex(string)))
         self.next_slide()
 
-    def bullet_slide(self, title, *bullets, auto_show_all=False):
+    def reveal(self, *mobjects, mode=None):
+        if mode is None:
+            mode = self.bullet_reveal
+        if mode == 'static':
+            # a slide still needs an animation, make it as short as possible
+            self.add(*mobjects)
+            self.wait(1 / manim.config.frame_rate)
+        else:
+            self.play(FadeIn(*mobjects))
+
+    def bullet_slide(self, title, *bullets, auto_show_all=False, reveal=None):
         title = self.slide_title(title)
         if not auto_show_all:
             self.transition(title)
@@ -295,15 +657,28 @@ class CustomSlide(AudioSlide):
         else:
             for bullet in bullets.submobjects:
                 if hasattr(bullet, 'footnote'):
-                    self.play(FadeIn(bullet, bullet.footnote))
+                    self.reveal(bullet, bullet.footnote, mode=reveal)
                 else:
-                    self.play(FadeIn(bullet))
+                    self.reveal(bullet, mode=reveal)
                 self.next_slide()
 
-    def image(self, image_path, image_region=None):
+    def image(self, image_path, image_region=None, full_resolution=False):
+        """Image fit to `image_region`.
+
+        Unless `full_resolution` is set (e.g. for zooming in), the image is
+        loaded at the pixel size it will occupy on screen, through a cache
+        of resized copies.
+        """
         assert Path(image_path).exists()
         if image_region is None:
             image_region = self.content_region()
+        if not full_resolution:
+            pixels_per_unit = manim.config['pixel_width'] / manim.config['frame_width']
+            image_path = downsampled_image(
+                image_path,
+                math.ceil(image_region.width * pixels_per_unit),
+                math.ceil(image_region.height * pixels_per_unit),
+            )
         image = ImageMobject(image_path)
         scale_to_fit_region(image, image_region)
         image.move_to(image_region)
@@ -321,7 +696,34 @@ class CustomSlide(AudioSlide):
             self.play(FadeIn(image))
         self.next_slide()
 
-    def bullet_image_slide(self, title, *bullets, image_path, image_bullet_index=0):
+    def video(self, video_path, region=None, fps=None, cache_size=32):
+        """Video fit to `region`, decoded at the pixel size it occupies on screen"""
+        from .mobjects.video import VideoMobject
+        assert Path(video_path).exists()
+        if region is None:
+            region = self.content_region()
+        pixels_per_unit = manim.config['pixel_width'] / manim.config['frame_width']
+        max_size = (
+            math.ceil(region.width * pixels_per_unit),
+            math.ceil(region.height * pixels_per_unit),
+        )
+        video = VideoMobject(video_path, fps=fps, max_size=max_size, cache_size=cache_size)
+        scale_to_fit_region(video, region)
+        video.move_to(region)
+        return video
+
+    def video_slide(self, title, video_path, fps=None, loop=False):
+        title = self.slide_title(title)
+        self.transition(title)
+        self.next_slide()
+        video = self.video(video_path, fps=fps)
+        self.play(FadeIn(video))
+        self.next_slide(loop=loop)
+        self.play(video.play())
+        self.next_slide()
+        return video
+
+    def bullet_image_slide(self, title, *bullets, image_path, image_bullet_index=0, reveal=None):
         title = self.slide_title(title)
         self.transition(title)
         self.next_slide()
@@ -331,9 +733,9 @@ class CustomSlide(AudioSlide):
 
         for i, bullet in enumerate(bullets.submobjects):
             if i == image_bullet_index:
-                self.play(FadeIn(bullet, image))
+                self.reveal(bullet, image, mode=reveal)
             else:
-                self.play(FadeIn(bullet))
+                self.reveal(bullet, mode=reveal)
             self.next_slide()
 
     def title_slide(self, title, author, animation=False, return_animation=False):
@@ -360,11 +762,25 @@ class CustomSlide(AudioSlide):
             ),)
         self.next_slide()
 
+    def code_listing(self, code_path, formatter_style='monokai', background='rectangle'):
+        """Highlighted listing of `code_path`, built once per file and style and copied after that"""
+        code_path = Path(code_path)
+        key = (str(code_path.resolve()), code_path.stat().st_mtime_ns, formatter_style, background)
+        cache = self.__dict__.setdefault('_code_cache', {})
+        if key not in cache:
+            cache[key] = CodeListing(
+                code_path,
+                formatter_style=formatter_style,
+                background=background,
+                paragraph_config={'color': WHITE}
+            )
+        return cache[key].copy()
+
     def code(self, code_path, region=None):
         assert Path(code_path).exists()
         if region is None:
             region = self.content_region()
-        code = Code(code_path, formatter_style='monokai', paragraph_config={'color': WHITE})
+        code = self.code_listing(code_path)
         scale_to_fit_region(code, region)
         code.move_to(region)
         return code
@@ -377,10 +793,70 @@ class CustomSlide(AudioSlide):
         self.play(FadeIn(code))
         self.next_slide()
 
+    def code_walkthrough(self, title, code_path, steps, reveal=False, max_lines=None, dim_opacity=0.3):
+        """Code slide stepping through `steps`, a list of `(start, end)` line
+        ranges (1-based, inclusive). Each step highlights its lines and dims
+        the others, or with `reveal` shows them along with the previous ones.
+        Listings longer than `max_lines` scroll to keep the current range in view.
+        """
+        title = self.slide_title(title)
+        self.transition(title)
+        self.next_slide()
+        region = self.content_region()
+        num_lines = len(highlight_code(code_path)[0])
+        scroll = max_lines is not None and max_lines < num_lines
+        if not scroll:
+            max_lines = num_lines
+        # all steps are transforms of this one listing
+        listing = self.code_listing(code_path, background=None if scroll else 'rectangle')
+        if scroll:
+            window = listing.line_group(1, max_lines)
+            listing.scale(min(region.width / listing.width, region.height / window.height))
+            listing.align_to(region, LEFT)
+        else:
+            scale_to_fit_region(listing, region)
+            listing.move_to(region)
+
+        shown = set()
+        top = 1
+        def view(first, last, highlight=True):
+            nonlocal top
+            if first < top or last - first + 1 >= max_lines:
+                top = first
+            elif last >= top + max_lines:
+                top = last - max_lines + 1
+            top = max(1, min(top, num_lines - max_lines + 1))
+            state = listing.copy()
+            if scroll:
+                # line numbers are never empty, unlike lines of code
+                state.shift((region.get_top()[1] - state.line_numbers[top-1].get_top()[1]) * UP)
+            for line in range(1, num_lines + 1):
+                if not top <= line < top + max_lines:
+                    opacity = 0.
+                elif reveal:
+                    opacity = 1. if line in shown else 0.
+                elif highlight:
+                    opacity = 1. if first <= line <= last else dim_opacity
+                else:
+                    opacity = 1.
+                state.set_line_opacity(line, opacity)
+            return state
+
+        listing.become(view(1, 1, highlight=False))
+        self.play(FadeIn(listing))
+        for first, last in steps:
+            self.next_slide()
+            if reveal:
+                shown.update(range(first, last + 1))
+            self.play(Transform(listing, view(first, last)))
+        self.next_slide()
+        return listing
+
     def enable_slide_numbers(self, prefix=''):
         self.counter = 0
         self.slide_number_prefix = prefix
-        slide_number = MathTex(prefix + "0")
+        self.slide_number_glyphs = GlyphCounter(prefix)
+        slide_number = self.slide_number_glyphs(0)
         region = self.footer_region(height_ratio=0.05)
         self.scale_to_fit(slide_number, region)
         self.center(slide_number, region)
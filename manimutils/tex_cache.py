@@ -0,0 +1,53 @@
+import dataclasses
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from manim import *
+from manim.utils.tex_file_writing import compile_tex, convert_to_svg, delete_nonsvg_files, generate_tex_file
+
+
+def template_to_dict(tex_template: TexTemplate) -> dict:
+    return {
+        field.name: getattr(tex_template, field.name)
+        for field in dataclasses.fields(tex_template)
+        if field.init
+    }
+
+
+def modified_expression(tex_string: str) -> str:
+    """The expression `SingleStringMathTex` actually hands to LaTeX for `tex_string`"""
+    # these methods don't touch instance state, so a bare instance is enough
+    return SingleStringMathTex.__new__(SingleStringMathTex)._get_modified_expression(tex_string)
+
+
+def _compile(expression: str, environment: str | None, tex_template: TexTemplate):
+    # Same steps as `tex_to_svg_file`, minus the cleanup which would
+    # delete the intermediate files of compilations running in parallel
+    tex_file = generate_tex_file(expression, environment, tex_template)
+    if tex_file.with_suffix('.svg').exists():
+        return
+    dvi_file = compile_tex(tex_file, tex_template.tex_compiler, tex_template.output_format)
+    convert_to_svg(dvi_file, tex_template.output_format)
+
+
+def compile_tex_batch(requests, max_workers=None):
+    """Populate manim's tex cache for `(expression, environment, tex_template)` triples.
+
+    Each compilation is a latex + dvisvgm subprocess, so a thread pool is
+    enough to run them in parallel. Expressions that are already cached
+    are skipped.
+    """
+    unique = {}
+    for expression, environment, tex_template in requests:
+        if tex_template is None:
+            tex_template = config['tex_template']
+        key = (expression, environment, json.dumps(template_to_dict(tex_template), sort_keys=True))
+        unique.setdefault(key, (expression, environment, tex_template))
+    if not unique:
+        return
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # list() so that exceptions are raised here
+        list(executor.map(lambda request: _compile(*request), unique.values()))
+    if not config['no_latex_cleanup']:
+        delete_nonsvg_files()
+
@@ -0,0 +1,43 @@
+import wave
+
+import pytest
+
+np = pytest.importorskip('numpy')
+pytest.importorskip('scipy')
+
+from manimutils.audio_source import WavSource
+
+
+def write_wav(path, samples, sample_width, sr=16000):
+    """Write integer `samples` (T or TxC) as PCM with `sample_width` bytes per sample"""
+    samples = np.asarray(samples, dtype=np.int64)
+    if samples.ndim == 1:
+        samples = samples[:, None]
+    frames = b''.join(
+        int(value).to_bytes(sample_width, 'little', signed=True)
+        for value in samples.ravel()
+    )
+    with wave.open(str(path), 'wb') as file:
+        file.setnchannels(samples.shape[1])
+        file.setsampwidth(sample_width)
+        file.setframerate(sr)
+        file.writeframes(frames)
+
+
+@pytest.mark.parametrize('sample_width', [2, 3])
+def test_pcm(tmp_path, sample_width):
+    full_scale = 2 ** (8 * sample_width - 1)
+    samples = np.stack([
+        np.array([0, full_scale // 2, -full_scale // 4, full_scale // 8]),
+        np.array([0, -full_scale // 2, full_scale // 4, full_scale // 8]),
+    ], axis=1)
+    file = tmp_path / 'audio.wav'
+    write_wav(file, samples, sample_width)
+
+    source = WavSource(file)
+    assert source.sr == 16000
+    assert source.num_channels == 2
+    assert source.num_samples == 4
+    np.testing.assert_allclose(source.peak / source.full_scale, 0.5)
+    np.testing.assert_allclose(source.mono(), [0, 0, 0, source.full_scale / 8])
+    np.testing.assert_allclose(source.as_float32(normalize=True)[:, 0], [0, 1, -0.5, 0.25])
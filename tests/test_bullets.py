@@ -0,0 +1,14 @@
+import pytest
+
+pytest.importorskip('manim')
+pytest.importorskip('manim_slides')
+
+from manim import RED
+
+from manimutils.slide import bullet_tex_strings
+
+
+def test_bullet_tex_strings_match_bulleted_list():
+    items, footnotes = bullet_tex_strings('first', RED, '\tsecond\nline')
+    assert items == ['first\\\\second\\\\line\\\\', 'first\\\\', 'second\\\\line\\\\']
+    assert footnotes == []
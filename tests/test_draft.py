@@ -0,0 +1,27 @@
+import pytest
+
+pytest.importorskip('manim')
+pytest.importorskip('manim_slides')
+
+from manim import config, tempconfig
+
+from manimutils import AudioSlide
+
+
+class DraftScene(AudioSlide):
+    draft = True
+    draft_resolution = (160, 90)
+    draft_frame_rate = 5
+
+    def construct(self):
+        pass
+
+
+def test_draft_config_is_restored(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv('MANIMUTILS_DRAFT', raising=False)
+    with tempconfig({'pixel_width': 640, 'pixel_height': 360, 'frame_rate': 30}):
+        scene = DraftScene()
+        assert scene.camera.pixel_width == 160
+        scene.construct()
+        assert (config.pixel_width, config.pixel_height, config.frame_rate) == (640, 360, 30)
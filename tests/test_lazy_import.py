@@ -0,0 +1,46 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+
+HEAVY_MODULES = ['torch', 'librosa', 'matplotlib', 'moviepy', 'pandas', 'tensorflow']
+
+
+def loaded_modules(code):
+    """Names in `sys.modules` after running `code` in a fresh interpreter"""
+    script = code + '\nimport sys, json\nprint(json.dumps(sorted(sys.modules)))\n'
+    result = subprocess.run(
+        [sys.executable, '-c', script],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(json.loads(result.stdout.splitlines()[-1]))
+
+
+def assert_not_loaded(modules):
+    loaded = [name for name in HEAVY_MODULES if name in modules]
+    assert not loaded, f'imported eagerly: {loaded}'
+
+
+def test_import_package():
+    assert_not_loaded(loaded_modules('import manimutils'))
+
+
+def test_import_custom_slide():
+    pytest.importorskip('manim')
+    pytest.importorskip('manim_slides')
+    assert_not_loaded(loaded_modules('from manimutils import CustomSlide'))
+
+
+def test_waveform_loads_audio_module():
+    pytest.importorskip('manim')
+    pytest.importorskip('torch')
+    pytest.importorskip('scipy')
+    modules = loaded_modules('import manimutils\nmanimutils.Waveform')
+    assert 'manimutils.mobjects.audio' in modules
@@ -0,0 +1,29 @@
+import pytest
+
+np = pytest.importorskip('numpy')
+pytest.importorskip('manim')
+pytest.importorskip('scipy')
+pytest.importorskip('torch')
+
+from manimutils.mobjects.audio import MinMaxPyramid
+
+
+def test_query_keeps_extremes_of_edge_blocks():
+    values = np.zeros(32)
+    values[6] = -1
+    values[16] = 1
+    indices = MinMaxPyramid(values).query(5, 17, 4)
+    assert 6 in indices and 16 in indices
+
+
+def test_query_keeps_extremes():
+    rng = np.random.default_rng(0)
+    values = rng.standard_normal(1000)
+    pyramid = MinMaxPyramid(values)
+    for _ in range(200):
+        start = int(rng.integers(0, len(values)))
+        stop = int(rng.integers(start, len(values)))
+        indices = pyramid.query(start, stop, int(rng.integers(2, 40)))
+        assert indices.min() >= start and indices.max() <= stop
+        assert values[indices].min() == values[start:stop+1].min()
+        assert values[indices].max() == values[start:stop+1].max()
@@ -0,0 +1,42 @@
+import pytest
+
+manim = pytest.importorskip('manim')
+pytest.importorskip('manim_slides')
+
+from manim import Circle, Scene, Square, tempconfig
+from manim.utils.hashing import get_hash_from_play_call
+
+from manimutils.slide import RasterizedWipe, rasterize_mobjects
+
+
+def transition_hash(outgoing):
+    # small frames are still far above manim's 1000 value hashing limit
+    with tempconfig({'pixel_width': 160, 'pixel_height': 90}):
+        scene = Scene()
+        current = rasterize_mobjects(outgoing)
+        scene.add(current)
+        animation = RasterizedWipe([current], [Square(color='#ff0000')])
+        return get_hash_from_play_call(scene, scene.renderer.camera, [animation], scene.mobjects)
+
+
+def test_transition_hash_depends_on_outgoing_slide():
+    assert transition_hash(Square()) != transition_hash(Circle())
+
+
+def test_transition_hash_is_stable():
+    assert transition_hash(Square()) == transition_hash(Square())
+
+
+def frozen_play_hash(frozen):
+    from manim import Dot, FadeIn
+    from manimutils.slide import CustomSlide
+    with tempconfig({'pixel_width': 160, 'pixel_height': 90}):
+        scene = CustomSlide()
+        scene.add(frozen)
+        scene.freeze(frozen)
+        animation = FadeIn(Dot())
+        return get_hash_from_play_call(scene, scene.renderer.camera, [animation], scene.mobjects)
+
+
+def test_play_hash_depends_on_frozen_layer():
+    assert frozen_play_hash(Square()) != frozen_play_hash(Circle())
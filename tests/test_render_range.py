@@ -0,0 +1,37 @@
+import json
+
+import pytest
+
+pytest.importorskip('manim')
+pytest.importorskip('manim_slides')
+
+from manim import Circle, Square, tempconfig
+
+from manimutils.slide import CustomSlide
+
+
+class Deck(CustomSlide):
+    reverse_mode = 'opt_in'
+    num_processes = 1
+
+    def construct(self):
+        for i in range(4):
+            self.transition(Square(side_length=1 + i) if i % 2 else Circle(radius=1 + i))
+            self.next_slide()
+
+
+def render(render_slides=None):
+    with tempconfig({'pixel_width': 64, 'pixel_height': 36, 'frame_rate': 5}):
+        scene = Deck()
+        scene.render_slides = render_slides
+        scene.render()
+    with open('slides/Deck.json') as f:
+        return [slide['file'] for slide in json.load(f)['slides']]
+
+
+def test_render_range_keeps_other_slides(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv('MANIMUTILS_RENDER_SLIDES', raising=False)
+    full = render()
+    assert len(full) == 4
+    assert render((2, 3)) == full